@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
+import os
 from pathlib import Path
 
 
@@ -23,8 +25,20 @@ def main() -> int:
         default="",
         help="Optional git revision / tag / commit SHA.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Parallel file downloads (default: 8).",
+    )
 
     args = parser.parse_args()
+
+    # Rust-based transfer backend, much faster for large weight files; must be set before the hub import.
+    # Only enable it when installed, otherwise huggingface_hub refuses to download.
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
     out_dir = Path(args.out_dir).expanduser().resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -51,6 +65,7 @@ def main() -> int:
         local_dir=out_dir.as_posix(),
         local_dir_use_symlinks=False,
         allow_patterns=allow,
+        max_workers=max(1, int(args.max_workers)),
     )
 
     print(f"Downloaded to: {out_dir}")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Quantize the VoiceGuard ONNX model to INT8 (dynamic quantization) for faster CPU inference."
+    )
+    parser.add_argument(
+        "--model",
+        default="models/voiceguard.onnx",
+        help="fp32 ONNX model (default: models/voiceguard.onnx)",
+    )
+    parser.add_argument(
+        "--out",
+        default="",
+        help="Output path (default: <model>.int8.onnx next to the model, picked up automatically by the app).",
+    )
+    parser.add_argument(
+        "--per-channel",
+        action="store_true",
+        help="Per-channel weight scales (slower to quantize, usually closer to fp32 accuracy).",
+    )
+
+    args = parser.parse_args()
+
+    model_path = Path(args.model).expanduser().resolve()
+    if not model_path.exists():
+        raise SystemExit(f"Model not found: {model_path}")
+    out_path = (
+        Path(args.out).expanduser().resolve()
+        if args.out
+        else model_path.with_name(f"{model_path.stem}.int8{model_path.suffix}")
+    )
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+    except Exception as exc:
+        raise SystemExit("onnxruntime (with onnx) is required: pip install onnxruntime onnx") from exc
+
+    quantize_dynamic(
+        model_input=model_path.as_posix(),
+        model_output=out_path.as_posix(),
+        weight_type=QuantType.QInt8,
+        per_channel=bool(args.per_channel),
+    )
+
+    print(f"Quantized model: {out_path}")
+    print("The app prefers `<name>.int8.onnx` next to `model.path` automatically; delete it to go back to fp32.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
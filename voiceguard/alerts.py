@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class AlertSegment:
@@ -9,6 +11,10 @@ class AlertSegment:
     end_sec: float
 
 
+_EMPTY_SEGMENTS = np.zeros((0, 2), dtype=np.float64)
+_EMPTY_SEGMENTS.setflags(write=False)
+
+
 class AlertTracker:
     def __init__(self, *, threshold: float, hold_sec: float, step_sec: float) -> None:
         self._threshold = float(threshold)
@@ -19,10 +25,26 @@ class AlertTracker:
         self._active = False
         self._active_start = 0.0
         self._segments: list[AlertSegment] = []
+        self._snapshot: tuple[AlertSegment, ...] = ()
+        self._array = _EMPTY_SEGMENTS
+
+    @property
+    def segments(self) -> tuple[AlertSegment, ...]:
+        # Immutable snapshot, rebuilt only when a segment is added: it can be handed to the UI thread
+        # as is, and consumers can detect "unchanged" with an identity check.
+        if len(self._snapshot) != len(self._segments):
+            self._snapshot = tuple(self._segments)
+        return self._snapshot
 
     @property
-    def segments(self) -> list[AlertSegment]:
-        return list(self._segments)
+    def segments_array(self) -> np.ndarray:
+        # Same segments as a read-only (N, 2) float64 array of (start_sec, end_sec), the layout the
+        # timeline paints from; identity-stable like `segments`.
+        if self._array.shape[0] != len(self._segments):
+            arr = np.array([(s.start_sec, s.end_sec) for s in self._segments], dtype=np.float64).reshape(-1, 2)
+            arr.setflags(write=False)
+            self._array = arr
+        return self._array
 
     @property
     def active(self) -> bool:
@@ -33,28 +55,31 @@ class AlertTracker:
         self._active = False
         self._active_start = 0.0
         self._segments.clear()
+        self._snapshot = ()
+        self._array = _EMPTY_SEGMENTS
 
     def update(self, *, t_start: float, t_end: float, p: float, is_speech: bool) -> bool:
+        # Hot per-window path: callers pass Python floats, so no defensive float() casts here.
         if not is_speech:
             if self._active:
-                self._segments.append(AlertSegment(start_sec=self._active_start, end_sec=float(t_end)))
+                self._segments.append(AlertSegment(start_sec=self._active_start, end_sec=t_end))
             self._active = False
             self._above_sec = 0.0
             return False
 
-        if float(p) >= self._threshold:
+        if p >= self._threshold:
             self._above_sec += self._step_sec
             if not self._active and self._above_sec >= self._hold_sec:
                 self._active = True
                 # Approximate the alert start as "current end - accumulated above time".
-                self._active_start = max(float(t_start), float(t_end) - self._above_sec)
+                self._active_start = max(t_start, t_end - self._above_sec)
         else:
             if self._active:
-                self._segments.append(AlertSegment(start_sec=self._active_start, end_sec=float(t_end)))
+                self._segments.append(AlertSegment(start_sec=self._active_start, end_sec=t_end))
             self._active = False
             self._above_sec = 0.0
 
-        return bool(self._active)
+        return self._active
 
     def finalize(self, *, t_end: float) -> None:
         if self._active:
@@ -62,3 +87,39 @@ class AlertTracker:
         self._active = False
         self._above_sec = 0.0
 
+
+def alert_segments_from_scores(
+    *,
+    t_starts: np.ndarray,
+    t_ends: np.ndarray,
+    p: np.ndarray,
+    is_speech: np.ndarray,
+    threshold: float,
+    hold_sec: float,
+    step_sec: float,
+) -> list[AlertSegment]:
+    # Offline equivalent of feeding every window to AlertTracker.update() and then finalize():
+    # runs of consecutive above-threshold speech windows become segments once held for hold_sec.
+    above = np.asarray(is_speech, dtype=bool) & (np.asarray(p, dtype=np.float64) >= float(threshold))
+    n = int(above.size)
+    if n == 0 or not above.any():
+        return []
+
+    edges = np.diff(np.concatenate(([0], above.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1) - 1  # inclusive
+    lengths = run_ends - run_starts + 1
+
+    # Accumulate step by step like the tracker does, so float rounding picks the same trigger window.
+    held = np.cumsum(np.full((int(lengths.max()),), float(step_sec)))
+    hits = np.flatnonzero(held >= float(hold_sec))
+    if hits.size == 0:
+        return []
+    k = int(hits[0])
+
+    keep = lengths > k
+    trigger = run_starts[keep] + k
+    starts = np.maximum(t_starts[trigger], t_ends[trigger] - held[k])
+    # Segment closes on the first window that drops out (or at the last window when the clip ends).
+    ends = t_ends[np.minimum(run_ends[keep] + 1, n - 1)]
+    return [AlertSegment(start_sec=float(s), end_sec=float(e)) for s, e in zip(starts, ends)]
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -7,12 +13,13 @@ from typing import Callable, Optional
 
 import numpy as np
 
-from voiceguard.alerts import AlertSegment, AlertTracker
+from voiceguard.alerts import AlertSegment, alert_segments_from_scores
 from voiceguard.config import AppConfig
 from voiceguard.engine import VoiceGuardEngine
 from voiceguard.preprocess import preprocess_audio
-from voiceguard.types import WindowScore
-from voiceguard.windowing import estimate_num_windows, iter_windows, window_params
+from voiceguard.types import WindowScore, WindowScoreArrays
+from voiceguard.vad import sliding_rms_db
+from voiceguard.windowing import estimate_num_windows, window_frames, window_params
 
 
 @dataclass(frozen=True)
@@ -43,10 +50,62 @@ class AnalysisResult:
     backend_note: str
     windows: list[WindowScore]
     summary: AnalysisSummary
+    arrays: WindowScoreArrays
 
 
 ProgressCallback = Callable[[int, int], None]
 
+_PROGRESS_INTERVAL_SEC = 0.05
+
+
+# Re-analysing the same file (e.g. after tweaking settings) reuses the resampled clip.
+# Kept in memory only, so no audio lands on disk behind the user's back (see storage.store_audio).
+_RESAMPLE_CACHE_SIZE = 2
+_resample_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_resample_cache_lock = threading.Lock()
+
+
+def _file_cache_key(source: str, audio: np.ndarray, orig_sr: int, target_sr: int) -> Optional[tuple]:
+    try:
+        path = Path(source).resolve()
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    return (path.as_posix(), int(st.st_mtime_ns), int(st.st_size), tuple(audio.shape), int(orig_sr), int(target_sr))
+
+
+def _preprocess_cached(
+    audio: np.ndarray, *, orig_sr: int, target_sr: int, cache_key: Optional[tuple]
+) -> np.ndarray:
+    if cache_key is not None:
+        with _resample_cache_lock:
+            cached = _resample_cache.get(cache_key)
+            if cached is not None:
+                _resample_cache.move_to_end(cache_key)
+                return cached
+
+    audio_rs = preprocess_audio(audio, orig_sr=orig_sr, target_sr=target_sr, normalize=False)
+    if cache_key is not None:
+        if audio_rs is audio:
+            audio_rs = audio_rs.copy()
+        audio_rs.setflags(write=False)
+        with _resample_cache_lock:
+            _resample_cache[cache_key] = audio_rs
+            while len(_resample_cache) > _RESAMPLE_CACHE_SIZE:
+                _resample_cache.popitem(last=False)
+    return audio_rs
+
+
+def _analysis_workers(source_kind: str) -> int:
+    # Offline files: score ML batches on several cores (the engine ignores this for the heuristic).
+    return max(1, (os.cpu_count() or 2) // 2) if str(source_kind).lower() == "file" else 1
+
+
+def warm_up_backend(config: AppConfig, *, source_kind: str = "file", base_dir: Optional[Path] = None) -> str:
+    # Loads the configured model into the engine's model cache, so the first analysis starts scoring
+    # right away. Returns the backend that will be used.
+    return str(VoiceGuardEngine(config, base_dir=base_dir, workers=_analysis_workers(source_kind)).backend)
+
 
 def analyze_audio(
     *,
@@ -61,14 +120,15 @@ def analyze_audio(
     created_at = datetime.now(timezone.utc).isoformat()
 
     target_sr = int(config.sample_rate)
-    audio_rs = preprocess_audio(audio, orig_sr=orig_sr, target_sr=target_sr, normalize=False)
+    cache_key = _file_cache_key(source, audio, orig_sr, target_sr) if str(source_kind).lower() == "file" else None
+    audio_rs = _preprocess_cached(audio, orig_sr=orig_sr, target_sr=target_sr, cache_key=cache_key)
 
     window_samples, hop_samples = window_params(
         sample_rate=target_sr, window_sec=float(config.window_sec), hop_sec=float(config.hop_sec)
     )
     total = estimate_num_windows(int(audio_rs.size), window_samples=window_samples, hop_samples=hop_samples)
 
-    engine = VoiceGuardEngine(config, base_dir=base_dir)
+    engine = VoiceGuardEngine(config, base_dir=base_dir, workers=_analysis_workers(source_kind))
     engine.reset_state()
 
     hold_sec = float(config.alert_hold_sec)
@@ -77,62 +137,76 @@ def analyze_audio(
         # Trigger on a single step to avoid missing brief synthetic segments.
         hold_sec = min(hold_sec, float(config.hop_sec))
 
-    alert = AlertTracker(
+    starts, frames = window_frames(audio_rs, window_samples=window_samples, hop_samples=hop_samples)
+    n_frames = int(frames.shape[0])
+    t_starts = starts / float(target_sr)
+    t_ends = (starts + window_samples) / float(target_sr)
+    # VAD gate for every window in one pass; silent windows never reach the model.
+    levels_db = sliding_rms_db(audio_rs, starts=starts, window_samples=window_samples)
+
+    windows: list[WindowScore] = []
+    p_fake = np.full((n_frames,), np.nan, dtype=np.float64)
+    p_smooth = np.full((n_frames,), np.nan, dtype=np.float64)
+    confidence = np.zeros((n_frames,), dtype=np.float64)
+    speech_mask = np.zeros((n_frames,), dtype=bool)
+    use_raw_for_alert = str(source_kind).lower() == "file"
+    batch_size = max(1, int(engine.batch_size)) * max(1, int(engine.workers))
+    # Progress is throttled by wall clock: per-window signals flood the Qt event loop on long files.
+    last_progress = time.monotonic()
+    with ThreadPoolExecutor(max_workers=engine.workers) if engine.workers > 1 else nullcontext() as pool:
+        for b0 in range(0, n_frames, batch_size):
+            b1 = min(b0 + batch_size, n_frames)
+            results = engine.infer_batch(frames[b0:b1], orig_sr=target_sr, rms_db=levels_db[b0:b1], executor=pool)
+            for i, result in enumerate(results, start=b0):
+                windows.append(WindowScore(t_start=float(t_starts[i]), t_end=float(t_ends[i]), result=result))
+                p_fake[i] = result.p_fake
+                p_smooth[i] = result.p_fake_smooth
+                confidence[i] = result.confidence
+                speech_mask[i] = result.is_speech
+
+            if progress is not None:
+                processed = len(windows)
+                now = time.monotonic()
+                if processed == total or now - last_progress >= _PROGRESS_INTERVAL_SEC:
+                    last_progress = now
+                    progress(processed, total)
+
+    # Same segments AlertTracker would produce window by window, found as runs over the whole clip.
+    alert_segments = alert_segments_from_scores(
+        t_starts=t_starts,
+        t_ends=t_ends,
+        p=p_fake if use_raw_for_alert else p_smooth,
+        is_speech=speech_mask,
         threshold=float(config.alert_threshold),
         hold_sec=float(hold_sec),
         step_sec=float(config.hop_sec),
     )
 
-    windows: list[WindowScore] = []
-    use_raw_for_alert = str(source_kind).lower() == "file"
-    processed = 0
-    for start, win in iter_windows(audio_rs, window_samples=window_samples, hop_samples=hop_samples):
-        t_start = float(start) / float(target_sr)
-        t_end = float(start + window_samples) / float(target_sr)
-        result = engine.infer_window(win, orig_sr=target_sr)
-        windows.append(WindowScore(t_start=t_start, t_end=t_end, result=result))
-
-        if result.is_speech:
-            p_alert = float(result.p_fake if use_raw_for_alert else result.p_fake_smooth)
-            alert.update(t_start=t_start, t_end=t_end, p=p_alert, is_speech=True)
-        else:
-            alert.update(t_start=t_start, t_end=t_end, p=0.0, is_speech=False)
-
-        processed += 1
-        if progress is not None and (processed == total or processed % 10 == 0):
-            progress(processed, total)
-
-    if windows:
-        alert.finalize(t_end=float(windows[-1].t_end))
-
     # For offline scoring prefer raw model probability (EMA smoothing is mainly for live UI stability).
-    p_vals = [float(w.result.p_fake) for w in windows if w.result.is_speech and not np.isnan(float(w.result.p_fake))]
-    conf_vals = [float(w.result.confidence) for w in windows if w.result.is_speech]
-    speech_windows = int(len(p_vals))
-    p_mean = float(np.mean(p_vals)) if p_vals else 0.0
-    p_max = float(np.max(p_vals)) if p_vals else 0.0
-    p_median = float(np.median(p_vals)) if p_vals else 0.0
-    p_p95 = float(np.quantile(p_vals, 0.95)) if p_vals else 0.0
-    fake_fraction = float(np.mean(np.asarray(p_vals) >= float(config.alert_threshold))) if p_vals else 0.0
-    conf_mean = float(np.mean(conf_vals)) if conf_vals else 0.0
-    conf_min = float(np.min(conf_vals)) if conf_vals else 0.0
+    p_vals = p_fake[speech_mask]
+    p_vals = p_vals[~np.isnan(p_vals)]
+    conf_vals = confidence[speech_mask]
+    speech_windows = int(p_vals.size)
+    if p_vals.size:
+        p_mean = float(np.mean(p_vals))
+        p_max = float(np.max(p_vals))
+        p_median, p_p95 = (float(v) for v in np.percentile(p_vals, [50.0, 95.0]))
+        fake_fraction = float(np.mean(p_vals >= float(config.alert_threshold)))
+    else:
+        p_mean = p_max = p_median = p_p95 = fake_fraction = 0.0
+    conf_mean = float(np.mean(conf_vals)) if conf_vals.size else 0.0
+    conf_min = float(np.min(conf_vals)) if conf_vals.size else 0.0
     duration_sec = float(audio_rs.size) / float(target_sr) if target_sr > 0 else 0.0
 
     # Extra "whole clip" inference (HF models often work better on longer context than 1–2s windows).
     p_clip = p_p95
-    if str(engine.backend).lower() == "hf" and p_vals:
+    if str(engine.backend).lower() == "hf" and p_vals.size:
         try:
             # Pick a short segment starting from the first detected speech window.
-            first_speech_start = 0.0
-            for w in windows:
-                if w.result.is_speech:
-                    first_speech_start = float(w.t_start)
-                    break
-            start = int(first_speech_start * float(target_sr))
+            start = int(starts[int(np.argmax(speech_mask))])
             clip_len = min(int(audio_rs.size - start), int(float(target_sr) * 12.0))
             if clip_len > 0:
-                clip_audio = audio_rs[start : start + clip_len]
-                clip_res = engine.infer_window(clip_audio, orig_sr=target_sr)
+                clip_res = engine.infer_window(audio_rs[start : start + clip_len], orig_sr=target_sr)
                 if clip_res.is_speech and not np.isnan(float(clip_res.p_fake)):
                     p_clip = float(clip_res.p_fake)
         except Exception:
@@ -153,7 +227,7 @@ def analyze_audio(
         fake_fraction=float(fake_fraction),
         confidence_mean=float(conf_mean),
         confidence_min=float(conf_min),
-        alert_segments=alert.segments,
+        alert_segments=alert_segments,
     )
 
     return AnalysisResult(
@@ -167,4 +241,12 @@ def analyze_audio(
         backend_note=str(engine.backend_note),
         windows=windows,
         summary=summary,
+        arrays=WindowScoreArrays(
+            t_start=t_starts,
+            t_end=t_ends,
+            p_fake=p_fake,
+            p_fake_smooth=p_smooth,
+            confidence=confidence,
+            is_speech=speech_mask,
+        ),
     )
@@ -6,7 +6,12 @@ from typing import Tuple
 import numpy as np
 
 
-def load_audio_file(path: Path) -> Tuple[np.ndarray, int]:
+_BLOCK_FRAMES = 1 << 16
+
+
+def load_audio_file(path: Path, *, mono: bool = False) -> Tuple[np.ndarray, int]:
+    # mono=True returns (frames,) float32 mixed down while decoding (same values as preprocess.to_mono),
+    # so the full multi-channel array is never held in memory.
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(str(path))
@@ -14,16 +19,24 @@ def load_audio_file(path: Path) -> Tuple[np.ndarray, int]:
     try:
         import soundfile as sf  # type: ignore
 
+        if mono:
+            return _read_mono_blocks(sf, path)
         audio, sr = sf.read(path, always_2d=True, dtype="float32")
         return audio, int(sr)
     except Exception:
         pass
 
+    try:
+        audio, sr = _load_with_av(path)
+        return (_mixdown(audio), sr) if mono else (audio, sr)
+    except Exception:
+        pass
+
     try:
         from pydub import AudioSegment  # type: ignore
     except Exception as exc:  # pragma: no cover
         raise RuntimeError(
-            "Failed to decode audio. For MP3, install ffmpeg and `pydub`."
+            "Failed to decode audio. For MP3, install `av` (or ffmpeg and `pydub`)."
         ) from exc
 
     seg = AudioSegment.from_file(path)
@@ -35,5 +48,55 @@ def load_audio_file(path: Path) -> Tuple[np.ndarray, int]:
 
     max_int = float(1 << (8 * seg.sample_width - 1))
     audio = (samples.astype(np.float32) / max_int).reshape((-1, 1))
-    return audio, sr
+    return (audio[:, 0], sr) if mono else (audio, sr)
+
+
+def _mixdown(audio: np.ndarray) -> np.ndarray:
+    if audio.shape[1] == 1:
+        return audio[:, 0]
+    return audio.mean(axis=1, dtype=np.float32)
+
+
+def _read_mono_blocks(sf, path: Path) -> Tuple[np.ndarray, int]:  # noqa: ANN001
+    with sf.SoundFile(path) as f:
+        sr = int(f.samplerate)
+        out = np.empty((max(int(f.frames), 0),), dtype=np.float32)
+        pos = 0
+        for block in f.blocks(blocksize=_BLOCK_FRAMES, dtype="float32", always_2d=True):
+            n = int(block.shape[0])
+            if pos + n > out.size:
+                # Frame count in the header can be an estimate (e.g. MP3); grow geometrically.
+                out = np.resize(out, max(pos + n, 2 * out.size))
+            if block.shape[1] == 1:
+                out[pos : pos + n] = block[:, 0]
+            else:
+                np.mean(block, axis=1, dtype=np.float32, out=out[pos : pos + n])
+            pos += n
+    return out[:pos], sr
+
+
+def _load_with_av(path: Path) -> Tuple[np.ndarray, int]:
+    import av  # type: ignore
+
+    chunks: list[np.ndarray] = []
+    with av.open(str(path)) as container:
+        stream = container.streams.audio[0]
+        sr = int(stream.rate or stream.codec_context.sample_rate)
+        for frame in container.decode(stream):
+            samples = frame.to_ndarray()
+            channels = len(frame.layout.channels)
+            # Planar: (channels, n); packed: (1, n * channels).
+            chunks.append(samples.T if frame.format.is_planar else samples.reshape(-1, channels))
+
+    if not chunks:
+        raise RuntimeError(f"No audio frames decoded from {path}")
+    raw = np.concatenate(chunks, axis=0)
 
+    if np.issubdtype(raw.dtype, np.floating):
+        return raw.astype(np.float32, copy=False), sr
+    info = np.iinfo(raw.dtype)
+    if info.min == 0:
+        # Unsigned PCM (u8) is offset-binary.
+        mid = float(info.max // 2 + 1)
+        return (raw.astype(np.float32) - mid) * (1.0 / mid), sr
+    return raw.astype(np.float32) * (1.0 / float(info.max + 1)), sr
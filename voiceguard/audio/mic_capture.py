@@ -1,22 +1,21 @@
 from __future__ import annotations
 
-import queue
 from typing import Optional
 
 import numpy as np
 
-from voiceguard.audio.chunk import AudioChunk
+from voiceguard.audio.ring_buffer import AudioRingBuffer
 
 
 class MicCapture:
     def __init__(self, device: Optional[int] = None) -> None:
         self._device = device
         self._stream = None
-        self._queue: "queue.Queue[AudioChunk]" = queue.Queue(maxsize=64)
+        self._queue = AudioRingBuffer()
         self._running = False
 
     @property
-    def queue(self) -> "queue.Queue[AudioChunk]":
+    def queue(self) -> AudioRingBuffer:
         return self._queue
 
     def start(self, preferred_sample_rate: int, block_sec: float = 0.10) -> int:
@@ -25,7 +24,6 @@ class MicCapture:
         if self._running:
             return int(preferred_sample_rate)
 
-        self._queue.queue.clear()  # type: ignore[attr-defined]
         self._running = True
 
         def callback(indata: np.ndarray, frames: int, time, status) -> None:  # noqa: ANN001
@@ -34,12 +32,8 @@ class MicCapture:
             if status:
                 # Drop status-only info; keep audio.
                 pass
-            mono = indata[:, 0].astype(np.float32, copy=True)
-            try:
-                self._queue.put_nowait(AudioChunk(samples=mono, sample_rate=int(stream_sr)))
-            except queue.Full:
-                # Backpressure: drop chunk to keep latency bounded.
-                pass
+            # Copies (and mixes down) into preallocated storage; drops the block when full.
+            self._queue.write(indata)
 
         # Prefer config SR, but fallback to device default if unsupported.
         stream_sr = int(preferred_sample_rate)
@@ -52,6 +46,8 @@ class MicCapture:
         for sr in (stream_sr, default_sr):
             try:
                 blocksize = max(0, int(sr * float(block_sec)))
+                # Room for ~64 blocks (same bound as the old chunk queue).
+                self._queue.reset(capacity=64 * max(blocksize, int(sr) // 10, 1), sample_rate=int(sr))
                 self._stream = sd.InputStream(
                     samplerate=sr,
                     device=self._device,
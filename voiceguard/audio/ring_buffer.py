@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+
+from voiceguard.audio.chunk import AudioChunk
+
+
+# Single-producer/single-consumer float32 sample ring: the audio callback only copies into
+# preallocated storage, the analyzer thread drains everything available as one AudioChunk.
+# Keeps the `queue.Queue.get(timeout=...)` / `queue.Empty` contract of the previous queue.
+class AudioRingBuffer:
+    def __init__(self, capacity: int = 0, sample_rate: int = 0) -> None:
+        self._buf = np.zeros((max(1, int(capacity)),), dtype=np.float32)
+        self._sample_rate = int(sample_rate)
+        # Monotonic sample counters: `_written` is only advanced by the producer,
+        # `_read` only by the consumer.
+        self._written = 0
+        self._read = 0
+        self._ready = threading.Event()
+        self._woken = False
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def reset(self, *, capacity: Optional[int] = None, sample_rate: Optional[int] = None) -> None:
+        # Not safe while a producer is running; call before (re)starting the stream.
+        if capacity is not None and int(capacity) != self._buf.size:
+            self._buf = np.zeros((max(1, int(capacity)),), dtype=np.float32)
+        if sample_rate is not None:
+            self._sample_rate = int(sample_rate)
+        self._written = 0
+        self._read = 0
+        self._woken = False
+        self._ready.clear()
+
+    def write(self, block: np.ndarray) -> bool:
+        # `block` is (frames,) or (frames, channels); channels are mixed down in place.
+        frames = int(block.shape[0])
+        if frames == 0:
+            return True
+        capacity = int(self._buf.size)
+        if frames > capacity - (self._written - self._read):
+            # Backpressure: drop the block to keep latency bounded.
+            return False
+
+        pos = self._written % capacity
+        first = min(frames, capacity - pos)
+        regions = [(self._buf[pos : pos + first], slice(0, first))]
+        if first < frames:
+            regions.append((self._buf[: frames - first], slice(first, frames)))
+
+        for dst, src in regions:
+            if block.ndim == 1:
+                np.copyto(dst, block[src], casting="same_kind")
+            elif block.shape[1] == 1:
+                np.copyto(dst, block[src, 0], casting="same_kind")
+            else:
+                # Mix down straight into the ring storage: no temporary, no dtype round trip.
+                np.mean(block[src], axis=1, dtype=np.float32, out=dst)
+
+        self._written += frames
+        self._ready.set()
+        return True
+
+    def wake(self) -> None:
+        # Makes a blocked (or the next) get() return early with queue.Empty, e.g. to stop a consumer
+        # that waits without a timeout.
+        self._woken = True
+        self._ready.set()
+
+    def get(self, timeout: Optional[float] = None) -> AudioChunk:
+        if self._written == self._read:
+            self._ready.clear()
+            # Re-check after clearing so a write (or wake) racing with clear() is not missed.
+            if self._written == self._read and not self._woken and not self._ready.wait(timeout):
+                raise queue.Empty
+
+        written = self._written
+        n = int(written - self._read)
+        if n <= 0:
+            self._woken = False
+            raise queue.Empty
+
+        capacity = int(self._buf.size)
+        pos = self._read % capacity
+        first = min(n, capacity - pos)
+        out = np.empty((n,), dtype=np.float32)
+        out[:first] = self._buf[pos : pos + first]
+        if first < n:
+            out[first:] = self._buf[: n - first]
+        self._read = written
+        return AudioChunk(samples=out, sample_rate=int(self._sample_rate))
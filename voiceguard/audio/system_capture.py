@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import queue
 from typing import Optional
 
 import numpy as np
 
-from voiceguard.audio.chunk import AudioChunk
+from voiceguard.audio.ring_buffer import AudioRingBuffer
 
 
 class SystemAudioCapture:
@@ -14,11 +13,11 @@ class SystemAudioCapture:
         self._loopback_requested = bool(loopback)
         self._loopback_active = False
         self._stream = None
-        self._queue: "queue.Queue[AudioChunk]" = queue.Queue(maxsize=64)
+        self._queue = AudioRingBuffer()
         self._running = False
 
     @property
-    def queue(self) -> "queue.Queue[AudioChunk]":
+    def queue(self) -> AudioRingBuffer:
         return self._queue
 
     @property
@@ -41,7 +40,6 @@ class SystemAudioCapture:
         if self._running:
             return int(preferred_sample_rate)
 
-        self._queue.queue.clear()  # type: ignore[attr-defined]
         self._running = True
 
         def callback(indata: np.ndarray, frames: int, time, status) -> None:  # noqa: ANN001
@@ -49,17 +47,8 @@ class SystemAudioCapture:
                 return
             if status:
                 pass
-            if indata.ndim == 1:
-                mono = indata.astype(np.float32, copy=True)
-            else:
-                if indata.shape[1] == 1:
-                    mono = indata[:, 0].astype(np.float32, copy=True)
-                else:
-                    mono = np.mean(indata, axis=1).astype(np.float32, copy=True)
-            try:
-                self._queue.put_nowait(AudioChunk(samples=mono, sample_rate=int(stream_sr)))
-            except queue.Full:
-                pass
+            # Copies (and mixes down) into preallocated storage; drops the block when full.
+            self._queue.write(indata)
 
         stream_sr = int(preferred_sample_rate)
 
@@ -99,6 +88,8 @@ class SystemAudioCapture:
         for sr in (stream_sr, default_sr):
             try:
                 blocksize = max(0, int(sr * float(block_sec)))
+                # Room for ~64 blocks (same bound as the old chunk queue).
+                self._queue.reset(capacity=64 * max(blocksize, int(sr) // 10, 1), sample_rate=int(sr))
                 self._stream = sd.InputStream(
                     samplerate=sr,
                     device=device,
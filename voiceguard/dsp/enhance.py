@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
-from scipy import signal
+from scipy import fft, signal
 
 from voiceguard.config import EnhanceConfig
+from voiceguard.dsp.windows import hann_window
+
+
+def _ensure_f32(x: np.ndarray) -> np.ndarray:
+    return x if x.dtype == np.float32 else x.astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def _butter_sos(sample_rate: int, low_hz: float, high_hz: float, order: int = 4) -> np.ndarray:
+    nyq = float(sample_rate) * 0.5
+    low = max(float(low_hz), 20.0) / nyq
+    high = min(float(high_hz), nyq * 0.98) / nyq
+    low = min(max(low, 0.001), 0.99)
+    high = min(max(high, low + 0.01), 0.999)
+    # float32 keeps sosfilt (and its state) in single precision for float32 blocks.
+    # Not frozen: sosfilt's Cython kernel requires a writable buffer. Callers must not mutate it.
+    return signal.butter(int(order), [low, high], btype="bandpass", output="sos").astype(np.float32)
 
 
 class NoiseReducer:
@@ -14,13 +32,9 @@ class NoiseReducer:
         self._strength = float(strength)
         self._ema = float(ema)
         self._noise_mag: Optional[np.ndarray] = None
-        self._window: Optional[np.ndarray] = None
-        self._window_len: int = 0
 
     def reset(self) -> None:
         self._noise_mag = None
-        self._window = None
-        self._window_len = 0
 
     def update_profile(self, audio: np.ndarray) -> None:
         if audio.size == 0:
@@ -36,30 +50,22 @@ class NoiseReducer:
             return audio
         spec = self._fft(audio)
         mag = np.abs(spec)
-        phase = np.exp(1j * np.angle(spec))
         noise_mag = self._noise_mag
         if noise_mag is None or noise_mag.shape != mag.shape:
             return audio
-        cleaned = np.maximum(0.0, mag - noise_mag * self._strength)
-        spec_clean = cleaned * phase
-        out = np.fft.irfft(spec_clean, n=audio.size)
-        return out.astype(np.float32, copy=False)
+        # Scale each bin by cleaned/|X| instead of rebuilding it from an explicit phase term.
+        gain = np.maximum(0.0, mag - noise_mag * self._strength) / np.maximum(mag, 1e-12)
+        spec_clean = spec * gain
+        # complex64 in -> float32 out; callers pass float32 (see AudioEnhancer).
+        return fft.irfft(spec_clean, n=audio.size, workers=-1)
 
     def _fft(self, audio: np.ndarray) -> np.ndarray:
-        x = audio.astype(np.float32, copy=False)
-        window = self._get_window(x.size)
-        return np.fft.rfft(x * window)
+        return fft.rfft(audio * hann_window(audio.size), workers=-1)
 
     def _fft_mag(self, audio: np.ndarray) -> np.ndarray:
         spec = self._fft(audio)
         return np.abs(spec)
 
-    def _get_window(self, n: int) -> np.ndarray:
-        if self._window is None or self._window_len != n:
-            self._window = np.hanning(n).astype(np.float32, copy=False)
-            self._window_len = int(n)
-        return self._window
-
 
 @dataclass
 class AudioEnhancer:
@@ -74,7 +80,11 @@ class AudioEnhancer:
         self._sos: Optional[np.ndarray] = None
         self._sos_state: Optional[np.ndarray] = None
         if self.config.bandpass:
-            self._sos = self._design_bandpass()
+            self._sos = _butter_sos(
+                int(self.sample_rate),
+                float(self.config.bandpass_low_hz),
+                float(self.config.bandpass_high_hz),
+            )
 
     def reset(self) -> None:
         self._noise.reset()
@@ -83,31 +93,25 @@ class AudioEnhancer:
     def update_noise(self, audio: np.ndarray) -> None:
         if not self.config.noise_reduction:
             return
-        x = self._apply_bandpass(audio) if self.config.bandpass else audio
+        x = _ensure_f32(audio)
+        if self.config.bandpass:
+            x = self._apply_bandpass(x)
         self._noise.update_profile(x)
 
     def process(self, audio: np.ndarray) -> np.ndarray:
-        x = audio.astype(np.float32, copy=False)
+        x = _ensure_f32(audio)
         if self.config.bandpass:
             x = self._apply_bandpass(x)
         if self.config.noise_reduction:
             x = self._noise.reduce(x)
-        return x.astype(np.float32, copy=False)
-
-    def _design_bandpass(self) -> np.ndarray:
-        nyq = float(self.sample_rate) * 0.5
-        low = max(float(self.config.bandpass_low_hz), 20.0) / nyq
-        high = min(float(self.config.bandpass_high_hz), nyq * 0.98) / nyq
-        low = min(max(low, 0.001), 0.99)
-        high = min(max(high, low + 0.01), 0.999)
-        return signal.butter(4, [low, high], btype="bandpass", output="sos")
+        return x
 
     def _apply_bandpass(self, audio: np.ndarray) -> np.ndarray:
         if self._sos is None:
-            return audio.astype(np.float32, copy=False)
-        x = audio.astype(np.float32, copy=False)
+            return audio
+        x = audio
         if self._sos_state is None:
-            zi = signal.sosfilt_zi(self._sos)
-            self._sos_state = zi * (float(x[0]) if x.size else 0.0)
+            zi = signal.sosfilt_zi(self._sos).astype(np.float32)
+            self._sos_state = zi * np.float32(x[0] if x.size else 0.0)
         x, self._sos_state = signal.sosfilt(self._sos, x, zi=self._sos_state)
-        return x.astype(np.float32, copy=False)
+        return x
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from voiceguard.dsp.windows import hann_window
+
 
 def _hz_to_mel(hz: np.ndarray) -> np.ndarray:
     return 2595.0 * np.log10(1.0 + (hz / 700.0))
@@ -42,19 +44,15 @@ def mel_filterbank(
     bins = np.floor((n_fft + 1) * hz / sample_rate).astype(int)
     bins = np.clip(bins, 0, n_fft // 2)
 
+    # Triangles for all bands at once: band i rises over [bins[i], bins[i+1]) and falls
+    # over [bins[i+1], bins[i+2]); bins are monotonic, so degenerate bands stay all-zero.
+    k = np.arange(n_fft // 2 + 1)[None, :]
+    left, center, right = bins[:-2, None], bins[1:-1, None], bins[2:, None]
+    f_left, f_center, f_right = fft_freqs[left], fft_freqs[center], fft_freqs[right]
+    freqs = fft_freqs[None, :]
     fb = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float64)
-    for i in range(n_mels):
-        left, center, right = bins[i], bins[i + 1], bins[i + 2]
-        if right <= left:
-            continue
-        if center > left:
-            fb[i, left:center] = (fft_freqs[left:center] - fft_freqs[left]) / (
-                fft_freqs[center] - fft_freqs[left] + 1e-12
-            )
-        if right > center:
-            fb[i, center:right] = (fft_freqs[right] - fft_freqs[center:right]) / (
-                fft_freqs[right] - fft_freqs[center] + 1e-12
-            )
+    np.divide(freqs - f_left, f_center - f_left + 1e-12, out=fb, where=(k >= left) & (k < center))
+    np.divide(f_right - freqs, f_right - f_center + 1e-12, out=fb, where=(k >= center) & (k < right))
 
     return fb.astype(dtype)
 
@@ -70,36 +68,52 @@ class LogMelSpecParams:
     fmax: float
 
 
+def stft_num_frames(n_samples: int, params: LogMelSpecParams) -> int:
+    win_length = int(params.win_length)
+    if int(n_samples) < win_length:
+        return 0
+    return (int(n_samples) - win_length) // max(1, int(params.hop_length)) + 1
+
+
 def log_mel_spectrogram(audio: np.ndarray, params: LogMelSpecParams) -> np.ndarray:
     return log_mel_spectrogram_with_filterbank(audio, params, filterbank=None)
 
 
 def log_mel_spectrogram_with_filterbank(
-    audio: np.ndarray, params: LogMelSpecParams, *, filterbank: np.ndarray | None
+    audio: np.ndarray,
+    params: LogMelSpecParams,
+    *,
+    filterbank: np.ndarray | None,
+    window: np.ndarray | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
+    # `out` (optional): preallocated float32 (n_mels, n_frames) destination, e.g. a row of a batch tensor.
     audio = audio.astype(np.float32, copy=False)
-    if audio.size == 0:
-        return np.zeros((params.n_mels, 0), dtype=np.float32)
+    n_frames = stft_num_frames(int(audio.size), params)
+    if out is not None and out.shape != (params.n_mels, n_frames):
+        raise ValueError(f"Expected out with shape {(params.n_mels, n_frames)}; got {out.shape}")
+    if n_frames == 0:
+        return out if out is not None else np.zeros((params.n_mels, 0), dtype=np.float32)
 
     try:
-        from scipy.signal import get_window, stft  # type: ignore
+        from scipy import fft  # type: ignore
     except Exception as exc:  # pragma: no cover
         raise RuntimeError("scipy is required for STFT") from exc
 
-    window = get_window("hann", params.win_length, fftbins=True)
-    n_overlap = max(0, params.win_length - params.hop_length)
-
-    _, _, zxx = stft(
-        audio,
-        fs=params.sample_rate,
-        nperseg=params.win_length,
-        noverlap=n_overlap,
-        nfft=params.n_fft,
-        window=window,
-        boundary=None,
-        padded=False,
-    )
-    power = np.square(np.abs(zxx)).astype(np.float32, copy=False)  # (freq, frames)
+    win_length = int(params.win_length)
+    hop_length = max(1, int(params.hop_length))
+
+    if window is None:
+        window = hann_window(win_length, periodic=True)
+    # Same frames and "spectrum" scaling as scipy.signal.stft(boundary=None, padded=False),
+    # without its validation/detrend overhead and the float64 complex intermediate.
+    # The 1/sum(window) scaling rides on the (short) window instead of a pass over the spectrum.
+    scaled_window = window * np.float32(1.0 / float(np.sum(window, dtype=np.float64)))
+    frames = np.lib.stride_tricks.sliding_window_view(audio, win_length)[::hop_length]
+    xw = frames * scaled_window  # (frames, win_length)
+    spec = fft.rfft(xw, n=int(params.n_fft), axis=-1, workers=-1)
+    power = np.square(spec.real)
+    power += np.square(spec.imag)  # (frames, freq), C-contiguous
 
     fb = filterbank
     if fb is None:
@@ -110,5 +124,14 @@ def log_mel_spectrogram_with_filterbank(
             fmin=params.fmin,
             fmax=params.fmax,
         )
-    mel = np.matmul(fb, power)  # (n_mels, frames)
-    return np.log(mel + 1e-10).astype(np.float32, copy=False)
+    # Keep both operands C-contiguous float32 so matmul stays on sgemm (a float64 filterbank
+    # would silently upcast the whole product).
+    fb = np.ascontiguousarray(fb, dtype=np.float32)
+    mel = np.matmul(power, fb.T)  # (frames, n_mels)
+    # log(mel + eps) in place on the small mel block; no extra temporaries.
+    mel += np.float32(1e-10)
+    if out is not None:
+        np.log(mel, out=out.T)
+        return out
+    np.log(mel, out=mel)
+    return np.ascontiguousarray(mel.T)  # (n_mels, frames)
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 import numpy as np
 
 
+@lru_cache(maxsize=8)
+def _polyphase_fir(up: int, down: int) -> np.ndarray:
+    # The low-pass resample_poly designs by default (Kaiser, beta=5), built once per rate pair;
+    # live capture resamples every window with the same (up, down).
+    from scipy.signal import firwin  # type: ignore
+
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    fir = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)).astype(np.float32)
+    fir.setflags(write=False)
+    return fir
+
+
 def resample_audio(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
     audio = audio.astype(np.float32, copy=False)
     if int(orig_sr) == int(target_sr):
@@ -24,5 +38,5 @@ def resample_audio(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarra
     if audio.size == 0:
         return audio
 
-    return resample_poly(audio, up=up, down=down).astype(np.float32, copy=False)
+    return resample_poly(audio, up=up, down=down, window=_polyphase_fir(up, down)).astype(np.float32, copy=False)
 
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=16)
+def hann_window(n: int, *, periodic: bool = False) -> np.ndarray:
+    # Symmetric (np.hanning) or periodic (scipy get_window(..., fftbins=True)) Hann, built once per size
+    # in float64 and kept as read-only float32 so windowed frames never upcast.
+    n = int(n)
+    if n <= 1:
+        window = np.ones((max(n, 0),), dtype=np.float32)
+    else:
+        denom = n if periodic else n - 1
+        window = (0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(n) / denom)).astype(np.float32)
+    window.setflags(write=False)
+    return window
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
@@ -10,21 +16,72 @@ from voiceguard.dsp.mel import (
     LogMelSpecParams,
     log_mel_spectrogram_with_filterbank,
     mel_filterbank,
+    stft_num_frames,
 )
 from voiceguard.dsp.enhance import AudioEnhancer
-from voiceguard.features import extract_indicators
-from voiceguard.inference import HfAudioClassifier, OnnxModel, heuristic_p_fake, heuristic_reasons
+from voiceguard.dsp.windows import hann_window
+from voiceguard.features import extract_indicators, extract_indicators_batch
+from voiceguard.inference import HfAudioClassifier, OnnxModel, heuristic_p_fake_batch, heuristic_reasons
 from voiceguard.preprocess import normalize_audio, preprocess_audio
 from voiceguard.types import InferenceResult
+from voiceguard.vad import rms_db as window_rms_db
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
     return float(min(max(x, lo), hi))
 
 
+# Re-scoring the same audio (re-analysis, backend/threshold comparisons) reuses its log-mels.
+# Module level because an engine is built per analysis; ~50 KB per 2 s window at default params.
+_LOG_MEL_CACHE_SIZE = 256
+_log_mel_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_log_mel_cache_lock = threading.Lock()
+
+
+# Loaded models, shared by every engine: an engine is built per analysis, and loading the
+# ONNX session / HF weights dominates time-to-first-window. Keyed by file identity so a
+# replaced model is reloaded. Loads run under the lock, so a warm-up and a first analysis
+# never load the same model twice.
+_MODEL_CACHE_SIZE = 2
+_model_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def _path_stamp(path: Optional[Path]) -> tuple:
+    if path is None:
+        return ()
+    try:
+        st = path.stat()
+    except OSError:
+        return ()
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def _cached_model(key: tuple, load):  # noqa: ANN001, ANN202
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is None:
+            model = load()
+            _model_cache[key] = model
+            while len(_model_cache) > _MODEL_CACHE_SIZE:
+                _model_cache.popitem(last=False)
+        else:
+            _model_cache.move_to_end(key)
+        return model
+
+
+@dataclass(frozen=True)
+class _WindowFront:
+    audio: np.ndarray  # resampled (and enhanced, for speech) window
+    rms_db: float
+    indicators: dict[str, float]
+    is_speech: bool
+
+
 class VoiceGuardEngine:
-    def __init__(self, config: AppConfig, *, base_dir: Optional[Path] = None) -> None:
+    def __init__(self, config: AppConfig, *, base_dir: Optional[Path] = None, workers: int = 1) -> None:
         self._config = config
+        self._workers = max(1, int(workers))
         self._base_dir = Path(base_dir) if base_dir is not None else Path(__file__).resolve().parents[1]
 
         self._requested_backend = str(config.model.backend).lower()
@@ -33,6 +90,7 @@ class VoiceGuardEngine:
 
         self._target_sr = int(config.sample_rate)
         self._ema_alpha = float(config.smoothing.ema_alpha)
+        self._ema_keep = 1.0 - self._ema_alpha
         self._ema: Optional[float] = None
         self._enhance_cfg: EnhanceConfig = config.enhance
         self._enhancer: Optional[AudioEnhancer] = None
@@ -46,13 +104,19 @@ class VoiceGuardEngine:
             fmin=float(config.model.fmin),
             fmax=float(config.model.fmax),
         )
-        self._mel_fb = mel_filterbank(
-            sample_rate=self._mel_params.sample_rate,
-            n_fft=self._mel_params.n_fft,
-            n_mels=self._mel_params.n_mels,
-            fmin=self._mel_params.fmin,
-            fmax=self._mel_params.fmax,
-        ).astype(np.float32, copy=False)
+        self._mel_fb = np.ascontiguousarray(
+            mel_filterbank(
+                sample_rate=self._mel_params.sample_rate,
+                n_fft=self._mel_params.n_fft,
+                n_mels=self._mel_params.n_mels,
+                fmin=self._mel_params.fmin,
+                fmax=self._mel_params.fmax,
+            ),
+            dtype=np.float32,
+        )
+        self._stft_window = hann_window(self._mel_params.win_length, periodic=True)
+        # Reusable log-mel batch tensor, one per scoring thread (shards may run concurrently).
+        self._buffers = threading.local()
 
         self._onnx: Optional[OnnxModel] = None
         self._hf: Optional[HfAudioClassifier] = None
@@ -64,7 +128,11 @@ class VoiceGuardEngine:
             model_path = (self._base_dir / str(config.model.path)).resolve()
             if model_path.exists():
                 try:
-                    self._onnx = OnnxModel(model_path)
+                    intra_threads = max(1, (os.cpu_count() or 1) // self._workers) if self._workers > 1 else 0
+                    self._onnx = _cached_model(
+                        ("onnx", model_path.as_posix(), _path_stamp(model_path), intra_threads),
+                        lambda: OnnxModel(model_path, intra_op_num_threads=intra_threads),
+                    )
                     self._backend_in_use = "onnx"
                 except Exception as exc:
                     self._onnx = None
@@ -88,18 +156,17 @@ class VoiceGuardEngine:
             if allow_hf:
                 try:
                     if local_path is not None and local_path.exists():
-                        self._hf = HfAudioClassifier(
-                            repo_id=hf_repo_id or local_path.as_posix(),
-                            local_dir=local_path,
-                            revision=hf_revision,
+                        repo_id = hf_repo_id or local_path.as_posix()
+                        self._hf = _cached_model(
+                            ("hf", repo_id, local_path.as_posix(), _path_stamp(local_path), hf_revision),
+                            lambda: HfAudioClassifier(repo_id=repo_id, local_dir=local_path, revision=hf_revision),
                         )
                     else:
                         if not hf_repo_id:
                             raise RuntimeError("HF backend requires model.hf_repo_id or model.hf_local_dir")
-                        self._hf = HfAudioClassifier(
-                            repo_id=hf_repo_id,
-                            local_dir=None,
-                            revision=hf_revision,
+                        self._hf = _cached_model(
+                            ("hf", hf_repo_id, None, (), hf_revision),
+                            lambda: HfAudioClassifier(repo_id=hf_repo_id, local_dir=None, revision=hf_revision),
                         )
                     self._backend_in_use = "hf"
                 except Exception as exc:
@@ -137,64 +204,178 @@ class VoiceGuardEngine:
         if self._enhancer is not None:
             self._enhancer.reset()
 
+    @property
+    def batch_size(self) -> int:
+        # ML backends amortize the forward pass over a batch, the heuristic scores a batch in one numpy pass.
+        return 16
+
+    @property
+    def workers(self) -> int:
+        # Concurrent scoring only pays off where the backend releases the GIL and we sized its threads.
+        return self._workers if self._backend_in_use == "onnx" else 1
+
     def infer_window(self, audio: np.ndarray, *, orig_sr: int) -> InferenceResult:
-        # VAD should see non-normalized signal (dBFS comparable across windows).
-        audio_rs = preprocess_audio(audio, orig_sr=orig_sr, target_sr=self._target_sr, normalize=False)
-        raw_indicators = extract_indicators(audio_rs, sample_rate=self._target_sr)
-        rms_db = float(raw_indicators.get("rms_db", float("-inf")))
-        is_speech = bool(rms_db > float(self._config.vad.rms_db_threshold))
-        if not is_speech:
-            if self._enhancer is not None:
-                self._enhancer.update_noise(audio_rs)
-            return InferenceResult(
-                p_fake=float("nan"),
-                p_fake_smooth=float("nan"),
-                confidence=0.0,
-                is_speech=False,
-                indicators=raw_indicators,
-                reasons=[],
-            )
-
-        audio_proc = audio_rs
-        if self._enhancer is not None:
-            audio_proc = self._enhancer.process(audio_rs)
+        return self.infer_batch([audio], orig_sr=orig_sr)[0]
+
+    def infer_batch(
+        self,
+        wins: Sequence[np.ndarray],
+        *,
+        orig_sr: int,
+        rms_db: Optional[Sequence[float]] = None,
+        executor: Optional[Executor] = None,
+        silent_indicators: bool = True,
+    ) -> list[InferenceResult]:
+        # Windows are processed in order: enhancer noise profile and EMA are stateful.
+        # `rms_db` (optional) are precomputed window levels; silent windows then skip the level pass and
+        # the model, but still report the full indicator set.
+        # `silent_indicators=False` reports only {"rms_db": level} for silent windows (no spectral pass);
+        # for live display, where nothing else is shown for silence. Offline reports keep the full set.
+        # With an `executor`, only the stateless model scoring runs concurrently, in batch_size shards.
+        threshold_db = float(self._config.vad.rms_db_threshold)
+        fronts: list[Optional[_WindowFront]] = []
+        # (index into fronts, audio, level, is_speech): indicators are extracted afterwards in one
+        # batched pass per window length.
+        pending: list[tuple[int, np.ndarray, float, bool]] = []
+        for i, audio in enumerate(wins):
+            # One dtype/layout conversion at the boundary; the float32 casts downstream are then no-ops.
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
+            # VAD should see non-normalized signal (dBFS comparable across windows).
+            audio_rs = preprocess_audio(audio, orig_sr=orig_sr, target_sr=self._target_sr, normalize=False)
+            if rms_db is not None and not float(rms_db[i]) > threshold_db:
+                level = float(rms_db[i])
+                if self._enhancer is not None:
+                    self._enhancer.update_noise(audio_rs)
+                if silent_indicators:
+                    pending.append((len(fronts), audio_rs, level, False))
+                    fronts.append(None)
+                else:
+                    fronts.append(_WindowFront(audio=audio_rs, rms_db=level, indicators={"rms_db": level}, is_speech=False))
+                continue
+
+            level = float(window_rms_db(audio_rs))
+            is_speech = bool(level > threshold_db)
+            if not is_speech:
+                if self._enhancer is not None:
+                    self._enhancer.update_noise(audio_rs)
+                if silent_indicators:
+                    raw_indicators = extract_indicators(audio_rs, sample_rate=self._target_sr)
+                else:
+                    raw_indicators = {"rms_db": level}
+                fronts.append(_WindowFront(audio=audio_rs, rms_db=level, indicators=raw_indicators, is_speech=False))
+                continue
 
-        indicators = extract_indicators(audio_proc, sample_rate=self._target_sr)
+            audio_proc = self._enhancer.process(audio_rs) if self._enhancer is not None else audio_rs
+            pending.append((len(fronts), audio_proc, level, True))
+            fronts.append(None)
 
+        by_size: dict[int, list[tuple[int, np.ndarray, float, bool]]] = {}
+        for item in pending:
+            by_size.setdefault(int(item[1].size), []).append(item)
+        for group in by_size.values():
+            batch_indicators = extract_indicators_batch(np.stack([a for _, a, _, _ in group]), self._target_sr)
+            for (idx, audio, level, is_speech), indicators in zip(group, batch_indicators):
+                fronts[idx] = _WindowFront(audio=audio, rms_db=level, indicators=indicators, is_speech=is_speech)
+
+        ready = [f for f in fronts if f is not None]
+        speech = [f for f in ready if f.is_speech]
+        batch_size = self.batch_size
+        if executor is not None and len(speech) > batch_size:
+            shards = [speech[i : i + batch_size] for i in range(0, len(speech), batch_size)]
+            scores = iter([score for part in executor.map(self._score_batch, shards) for score in part])
+        else:
+            scores = iter(self._score_batch(speech)) if speech else iter(())
+
+        results: list[InferenceResult] = []
+        for front in ready:
+            if not front.is_speech:
+                results.append(
+                    InferenceResult(
+                        p_fake=float("nan"),
+                        p_fake_smooth=float("nan"),
+                        confidence=0.0,
+                        is_speech=False,
+                        indicators=front.indicators,
+                        reasons=[],
+                    )
+                )
+                continue
+            p_fake, model_confidence, reasons = next(scores)
+            results.append(self._finish(front, p_fake=p_fake, model_confidence=model_confidence, reasons=reasons))
+        return results
+
+    def _score_batch(self, fronts: list[_WindowFront]) -> list[tuple[float, float, list[str]]]:
         backend = self.backend
-        reasons: list[str]
         if backend == "onnx":
             if self._onnx is None:  # pragma: no cover
                 raise RuntimeError("model.backend=onnx but ONNX model is not initialized.")
-            audio_norm = normalize_audio(audio_proc)
-            log_mel = log_mel_spectrogram_with_filterbank(
-                audio_norm,
-                self._mel_params,
-                filterbank=self._mel_fb,
-            )
-            p_fake = float(self._onnx.predict(log_mel))
-            reasons = heuristic_reasons(indicators)
-            model_confidence = float(abs(p_fake - 0.5) * 2.0)
-        elif backend == "hf":
+            log_mels = self._log_mel_batch(len(fronts), stft_num_frames(int(fronts[0].audio.size), self._mel_params))
+            for f, out in zip(fronts, log_mels):
+                self._log_mel_into(normalize_audio(f.audio), out)
+            p_fakes = self._onnx.predict_batch(log_mels)
+            return [
+                (float(p), float(abs(float(p) - 0.5) * 2.0), heuristic_reasons(f.indicators))
+                for p, f in zip(p_fakes, fronts)
+            ]
+        if backend == "hf":
             if self._hf is None:  # pragma: no cover
                 raise RuntimeError("model.backend=hf but HF model is not initialized.")
-            pred = self._hf.predict(audio_proc, sample_rate=self._target_sr)
-            p_fake = float(pred.p_fake)
-            reasons = heuristic_reasons(indicators)
-            model_confidence = float(pred.model_confidence)
-        else:
-            p_fake, reasons = heuristic_p_fake(indicators)
-            model_confidence = float(abs(p_fake - 0.5) * 2.0)
+            preds = self._hf.predict_batch([f.audio for f in fronts], sample_rate=self._target_sr)
+            return [
+                (float(pred.p_fake), float(pred.model_confidence), heuristic_reasons(f.indicators))
+                for pred, f in zip(preds, fronts)
+            ]
+
+        p_fakes, reasons = heuristic_p_fake_batch([f.indicators for f in fronts])
+        return [(float(p), float(abs(float(p) - 0.5) * 2.0), r) for p, r in zip(p_fakes, reasons)]
+
+    def _log_mel_into(self, audio: np.ndarray, out: np.ndarray) -> None:
+        key = (self._mel_params, hashlib.blake2b(np.ascontiguousarray(audio).data, digest_size=16).digest())
+        with _log_mel_cache_lock:
+            cached = _log_mel_cache.get(key)
+            if cached is not None:
+                _log_mel_cache.move_to_end(key)
+        if cached is not None and cached.shape == out.shape:
+            out[...] = cached
+            return
+
+        log_mel_spectrogram_with_filterbank(
+            audio,
+            self._mel_params,
+            filterbank=self._mel_fb,
+            window=self._stft_window,
+            out=out,
+        )
+        entry = out.copy()
+        entry.setflags(write=False)
+        with _log_mel_cache_lock:
+            _log_mel_cache[key] = entry
+            while len(_log_mel_cache) > _LOG_MEL_CACHE_SIZE:
+                _log_mel_cache.popitem(last=False)
+
+    def _log_mel_batch(self, batch: int, n_frames: int) -> np.ndarray:
+        # Windows have a fixed length, so the same (batch, n_mels, n_frames) block is reused per thread.
+        buf: Optional[np.ndarray] = getattr(self._buffers, "log_mels", None)
+        shape = (self._mel_params.n_mels, int(n_frames))
+        if buf is None or buf.shape[0] < batch or buf.shape[1:] != shape:
+            buf = np.empty((max(int(batch), self.batch_size),) + shape, dtype=np.float32)
+            self._buffers.log_mels = buf
+        return buf[:batch]
 
+    def _finish(
+        self, front: _WindowFront, *, p_fake: float, model_confidence: float, reasons: list[str]
+    ) -> InferenceResult:
         if self._ema is None:
             self._ema = float(p_fake)
         else:
-            self._ema = float(self._ema_alpha) * float(p_fake) + (1.0 - float(self._ema_alpha)) * float(self._ema)
+            # Scalar recursion on purpose: state carries across batches and live windows, and
+            # lfilter only wins over whole-file arrays, which would mean rebuilding every result.
+            self._ema = self._ema_alpha * float(p_fake) + self._ema_keep * self._ema
 
-        p_smooth = float(self._ema)
+        p_smooth = self._ema
 
         # Confidence: blend signal quality + model confidence.
-        quality = _clamp((rms_db - float(self._config.vad.rms_db_threshold)) / 30.0, 0.0, 1.0)
+        quality = _clamp((front.rms_db - float(self._config.vad.rms_db_threshold)) / 30.0, 0.0, 1.0)
         conf = _clamp(float(model_confidence), 0.0, 1.0)
         confidence = _clamp(0.15 + 0.85 * (0.60 * quality + 0.40 * conf), 0.0, 1.0)
 
@@ -203,6 +384,6 @@ class VoiceGuardEngine:
             p_fake_smooth=float(_clamp(p_smooth, 0.0, 1.0)),
             confidence=float(confidence),
             is_speech=True,
-            indicators=indicators,
+            indicators=front.indicators,
             reasons=reasons,
         )
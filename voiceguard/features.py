@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
+from scipy import fft
 
+from voiceguard.dsp.windows import hann_window
 from voiceguard.vad import rms_db
 
 
@@ -10,11 +14,43 @@ def zero_crossing_rate(audio: np.ndarray) -> float:
     if audio.size < 2:
         return 0.0
     signs = np.signbit(audio)
-    return float(np.mean(signs[1:] != signs[:-1]))
+    # Integer count instead of a float mean over the bool mask; same value, ~3x faster.
+    return float(np.count_nonzero(signs[1:] != signs[:-1]) / (audio.size - 1))
+
+
+@lru_cache(maxsize=8)
+def _spectrum_axis(n: int, sample_rate: int, hf_cut_hz: float) -> tuple[np.ndarray, int]:
+    freqs = fft.rfftfreq(n, d=1.0 / float(sample_rate)).astype(np.float32, copy=False)
+    freqs.setflags(write=False)
+    return freqs, int(np.searchsorted(freqs, np.float32(hf_cut_hz), side="left"))
+
+
+# Defaults shared by the per-window and batched indicator paths.
+_HF_CUT_HZ = 6000.0
+_ROLLOFF = 0.85
+
+_ROLLOFF_BLOCK = 512
+
+
+def _rolloff_index(power: np.ndarray, fraction: float) -> int:
+    # First bin where the running energy reaches `fraction` of the total. Block sums locate the
+    # crossing, then only that block is accumulated: no spectrum-sized cumsum per window.
+    n = int(power.size)
+    if n == 0:
+        return 0
+    block_sums = np.add.reduceat(power, np.arange(0, n, _ROLLOFF_BLOCK), dtype=np.float64)
+    running = np.cumsum(block_sums)
+    target = float(fraction) * float(running[-1])
+    block = min(int(np.searchsorted(running, target, side="left")), int(running.size) - 1)
+    start = block * _ROLLOFF_BLOCK
+    inner = np.cumsum(power[start : start + _ROLLOFF_BLOCK], dtype=np.float64)
+    if block:
+        inner += running[block - 1]
+    return start + int(np.searchsorted(inner, target, side="left"))
 
 
 def spectral_indicators(
-    audio: np.ndarray, sample_rate: int, *, hf_cut_hz: float = 6000.0, rolloff: float = 0.85
+    audio: np.ndarray, sample_rate: int, *, hf_cut_hz: float = _HF_CUT_HZ, rolloff: float = _ROLLOFF
 ) -> dict[str, float]:
     audio = audio.astype(np.float32, copy=False)
     if audio.size == 0:
@@ -27,26 +63,32 @@ def spectral_indicators(
         }
 
     n = int(audio.size)
-    window = np.hanning(n).astype(np.float32, copy=False)
-    xw = audio * window
+    xw = audio * hann_window(n)
 
-    power = np.square(np.abs(np.fft.rfft(xw))).astype(np.float32, copy=False)
-    freqs = np.fft.rfftfreq(n, d=1.0 / float(sample_rate)).astype(np.float32, copy=False)
+    # scipy.fft keeps float32 end to end (np.fft would upcast to complex128).
+    spec = fft.rfft(xw, workers=-1)
+    power = np.square(spec.real)
+    power += np.square(spec.imag)
+    freqs, hf_start = _spectrum_axis(n, int(sample_rate), float(hf_cut_hz))
 
+    # Weighted sums as dot products: one pass each, no (freqs * power) temporaries.
     total = float(np.sum(power)) + 1e-12
-    centroid = float(np.sum(freqs * power) / total)
-    bandwidth = float(np.sqrt(np.sum(np.square(freqs - centroid) * power) / total))
+    centroid = float(np.dot(freqs, power) / total)
+    dev = freqs - np.float32(centroid)
+    np.square(dev, out=dev)
+    bandwidth = float(np.sqrt(np.dot(dev, power) / total))
 
-    cumsum = np.cumsum(power, dtype=np.float64)
-    target = float(rolloff) * float(cumsum[-1] if cumsum.size else 0.0)
-    rolloff_idx = int(np.searchsorted(cumsum, target, side="left")) if cumsum.size else 0
-    rolloff_idx = int(np.clip(rolloff_idx, 0, freqs.size - 1))
+    rolloff_idx = int(np.clip(_rolloff_index(power, float(rolloff)), 0, freqs.size - 1))
     rolloff_hz = float(freqs[rolloff_idx]) if freqs.size else 0.0
 
-    hf_ratio = float(np.sum(power[freqs >= float(hf_cut_hz)]) / total)
+    # freqs is sorted, so the >= hf_cut band is a tail slice.
+    hf_ratio = float(np.sum(power[hf_start:]) / total)
 
     eps = 1e-12
-    flatness = float(np.exp(np.mean(np.log(power + eps))) / (np.mean(power + eps)))
+    shifted = power + eps
+    arith_mean = np.mean(shifted)
+    np.log(shifted, out=shifted)
+    flatness = float(np.exp(np.mean(shifted)) / arith_mean)
     flatness = float(np.clip(flatness, 0.0, 1.0))
 
     return {
@@ -65,3 +107,78 @@ def extract_indicators(audio: np.ndarray, sample_rate: int) -> dict[str, float]:
     indicators.update(spectral_indicators(audio, sample_rate))
     return indicators
 
+
+def _rolloff_index_batch(power: np.ndarray, fraction: float) -> np.ndarray:
+    # _rolloff_index for every row of a (B, F) power spectrum at once.
+    b, n = power.shape
+    if n == 0:
+        return np.zeros((b,), dtype=np.int64)
+    block_sums = np.add.reduceat(power, np.arange(0, n, _ROLLOFF_BLOCK), axis=1, dtype=np.float64)
+    running = np.cumsum(block_sums, axis=1)
+    target = float(fraction) * running[:, -1]
+    reached = running >= target[:, None]
+    block = np.where(reached.any(axis=1), np.argmax(reached, axis=1), running.shape[1] - 1)
+    start = block * _ROLLOFF_BLOCK
+    cols = start[:, None] + np.arange(_ROLLOFF_BLOCK)
+    inner = np.where(cols < n, np.take_along_axis(power, np.minimum(cols, n - 1), axis=1), 0.0)
+    inner = np.cumsum(inner, axis=1, dtype=np.float64)
+    rows = np.arange(b)
+    inner[block > 0] += running[rows[block > 0], block[block > 0] - 1][:, None]
+    hit = inner >= target[:, None]
+    return start + np.where(hit.any(axis=1), np.argmax(hit, axis=1), _ROLLOFF_BLOCK)
+
+
+def extract_indicators_batch(frames: np.ndarray, sample_rate: int) -> list[dict[str, float]]:
+    # extract_indicators for a (B, N) stack of equal-length windows: each step is one array op over
+    # the whole batch (NumPy/scipy.fft drop the GIL inside them) instead of ~20 small calls per window.
+    frames = np.asarray(frames, dtype=np.float32)
+    if frames.ndim != 2 or frames.shape[0] == 0 or frames.shape[1] < 2:
+        return [extract_indicators(x, sample_rate) for x in frames]
+
+    n = int(frames.shape[1])
+    levels = 20.0 * np.log10(np.sqrt(np.einsum("ij,ij->i", frames, frames) / n).astype(np.float64) + 1e-12)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (n - 1)
+
+    spec = fft.rfft(frames * hann_window(n), axis=-1, workers=-1)
+    power = np.square(spec.real)
+    power += np.square(spec.imag)
+    del spec
+    freqs, hf_start = _spectrum_axis(n, int(sample_rate), _HF_CUT_HZ)
+
+    total = np.sum(power, axis=1) + 1e-12
+    centroid = (power @ freqs) / total
+    dev = freqs[None, :] - centroid[:, None].astype(np.float32)
+    np.square(dev, out=dev)
+    bandwidth = np.sqrt(np.einsum("ij,ij->i", dev, power) / total)
+    del dev
+
+    rolloff_idx = np.clip(_rolloff_index_batch(power, _ROLLOFF), 0, freqs.size - 1)
+    rolloff_hz = freqs[rolloff_idx]
+    hf_ratio = np.sum(power[:, hf_start:], axis=1) / total
+
+    power += 1e-12
+    arith_mean = np.mean(power, axis=1)
+    np.log(power, out=power)
+    flatness = np.clip(np.exp(np.mean(power, axis=1)) / arith_mean, 0.0, 1.0)
+
+    return [
+        {
+            "rms_db": float(level),
+            "zcr": float(z),
+            "spectral_centroid_hz": float(c),
+            "spectral_bandwidth_hz": float(bw),
+            "spectral_rolloff_hz": float(r),
+            "hf_energy_ratio": float(h),
+            "spectral_flatness": float(f),
+        }
+        for level, z, c, bw, r, h, f in zip(
+            levels.tolist(),
+            zcr.tolist(),
+            centroid.tolist(),
+            bandwidth.tolist(),
+            rolloff_hz.tolist(),
+            hf_ratio.tolist(),
+            flatness.tolist(),
+        )
+    ]
@@ -1,10 +1,11 @@
 __all__ = [
     "heuristic_p_fake",
+    "heuristic_p_fake_batch",
     "heuristic_reasons",
     "HfAudioClassifier",
     "OnnxModel",
 ]
 
-from voiceguard.inference.heuristic import heuristic_p_fake, heuristic_reasons
+from voiceguard.inference.heuristic import heuristic_p_fake, heuristic_p_fake_batch, heuristic_reasons
 from voiceguard.inference.hf_backend import HfAudioClassifier
 from voiceguard.inference.onnx_backend import OnnxModel
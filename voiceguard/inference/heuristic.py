@@ -1,7 +1,19 @@
 from __future__ import annotations
 
 import math
-from typing import Mapping, Tuple
+from typing import Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Reference levels of the demo heuristic: below these a window starts to look synthetic.
+_HF_RATIO_REF = 0.06
+_ROLLOFF_REF_HZ = 4200.0
+_FLATNESS_REF = 0.12
+
+# Thresholds for the human-readable reasons.
+_HF_RATIO_LOW = 0.02
+_ROLLOFF_LOW_HZ = 3200.0
+_FLATNESS_LOW = 0.08
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -12,36 +24,58 @@ def _sigmoid(x: float) -> float:
     return float(1.0 / (1.0 + math.exp(-x)))
 
 
+def _spectral_features(indicators: Mapping[str, float]) -> Tuple[float, float, float]:
+    return (
+        float(indicators.get("hf_energy_ratio", 0.0)),
+        float(indicators.get("spectral_rolloff_hz", 0.0)),
+        float(indicators.get("spectral_flatness", 0.0)),
+    )
+
+
 def heuristic_p_fake(indicators: Mapping[str, float]) -> Tuple[float, list[str]]:
-    hf_ratio = float(indicators.get("hf_energy_ratio", 0.0))
-    rolloff_hz = float(indicators.get("spectral_rolloff_hz", 0.0))
-    flatness = float(indicators.get("spectral_flatness", 0.0))
+    hf_ratio, rolloff_hz, flatness = _spectral_features(indicators)
 
     # Very rough, demo-only heuristic:
     # - many synthetic/over-compressed samples show reduced HF energy / rolloff
     # - overly "sterile" spectrum can have low flatness
-    cutoff_score = _clamp((0.06 - hf_ratio) / 0.06, 0.0, 1.0)
-    rolloff_score = _clamp((4200.0 - rolloff_hz) / 4200.0, 0.0, 1.0)
-    flat_score = _clamp((0.12 - flatness) / 0.12, 0.0, 1.0)
+    cutoff_score = _clamp((_HF_RATIO_REF - hf_ratio) / _HF_RATIO_REF, 0.0, 1.0)
+    rolloff_score = _clamp((_ROLLOFF_REF_HZ - rolloff_hz) / _ROLLOFF_REF_HZ, 0.0, 1.0)
+    flat_score = _clamp((_FLATNESS_REF - flatness) / _FLATNESS_REF, 0.0, 1.0)
 
     raw = 0.50 * cutoff_score + 0.35 * rolloff_score + 0.15 * flat_score
     p_fake = _sigmoid((raw - 0.35) * 7.0)
 
-    reasons = heuristic_reasons(indicators)
+    reasons = _reasons(hf_ratio, rolloff_hz, flatness)
 
     return float(_clamp(p_fake, 0.0, 1.0)), reasons
 
 
+def heuristic_p_fake_batch(indicators: Sequence[Mapping[str, float]]) -> Tuple[np.ndarray, list[list[str]]]:
+    # Same score as heuristic_p_fake for a whole batch of windows in a few numpy ops.
+    feats = np.array([_spectral_features(ind) for ind in indicators], dtype=np.float64).reshape(-1, 3)
+    hf_ratio, rolloff_hz, flatness = feats.T
+
+    cutoff_score = np.clip((_HF_RATIO_REF - hf_ratio) / _HF_RATIO_REF, 0.0, 1.0)
+    rolloff_score = np.clip((_ROLLOFF_REF_HZ - rolloff_hz) / _ROLLOFF_REF_HZ, 0.0, 1.0)
+    flat_score = np.clip((_FLATNESS_REF - flatness) / _FLATNESS_REF, 0.0, 1.0)
+
+    raw = 0.50 * cutoff_score + 0.35 * rolloff_score + 0.15 * flat_score
+    p_fake = np.clip(1.0 / (1.0 + np.exp(-(raw - 0.35) * 7.0)), 0.0, 1.0)
+
+    reasons = [_reasons(*row) for row in feats.tolist()]
+    return p_fake, reasons
+
+
 def heuristic_reasons(indicators: Mapping[str, float]) -> list[str]:
-    hf_ratio = float(indicators.get("hf_energy_ratio", 0.0))
-    rolloff_hz = float(indicators.get("spectral_rolloff_hz", 0.0))
-    flatness = float(indicators.get("spectral_flatness", 0.0))
+    return _reasons(*_spectral_features(indicators))
+
 
+def _reasons(hf_ratio: float, rolloff_hz: float, flatness: float) -> list[str]:
     reasons: list[str] = []
-    if hf_ratio < 0.02:
+    if hf_ratio < _HF_RATIO_LOW:
         reasons.append("низкая доля энергии в ВЧ (возможен срез/кодек/TTS)")
-    if rolloff_hz < 3200.0:
+    if rolloff_hz < _ROLLOFF_LOW_HZ:
         reasons.append("низкий spectral roll-off (возможен срез ВЧ)")
-    if flatness < 0.08:
+    if flatness < _FLATNESS_LOW:
         reasons.append("низкая spectral flatness (слишком 'стерильно/тонально')")
     return reasons
@@ -13,8 +13,34 @@ def _softmax(x: np.ndarray, axis: int = -1) -> np.ndarray:
     return ex / (np.sum(ex, axis=axis, keepdims=True) + 1e-12)
 
 
+_CPU_PROVIDERS = ("DnnlExecutionProvider", "OpenVINOExecutionProvider")
+_GPU_PROVIDERS = ("TensorrtExecutionProvider", "CUDAExecutionProvider")
+
+
+def _gpu_providers(available: set[str], model_path: Path) -> list:
+    providers: list = []
+    if "TensorrtExecutionProvider" in available:
+        # TensorRT builds an engine per input shape on first use; cache them next to the model.
+        cache_dir = model_path.parent / ".trt_cache"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            trt_opts = {"trt_engine_cache_enable": True, "trt_engine_cache_path": cache_dir.as_posix()}
+        except OSError:
+            trt_opts = {}
+        trt_opts["trt_fp16_enable"] = True
+        providers.append(("TensorrtExecutionProvider", trt_opts))
+    if "CUDAExecutionProvider" in available:
+        providers.append("CUDAExecutionProvider")
+    return providers
+
+
+def _quantized_path(path: Path) -> Path:
+    # models/voiceguard.onnx -> models/voiceguard.int8.onnx (see scripts/quantize_onnx_model.py)
+    return path.with_name(f"{path.stem}.int8{path.suffix}")
+
+
 class OnnxModel:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, intra_op_num_threads: int = 0) -> None:
         self._path = Path(path)
         if not self._path.exists():
             raise FileNotFoundError(str(self._path))
@@ -26,16 +52,50 @@ class OnnxModel:
                 "onnxruntime is required for model.backend=onnx; install `onnxruntime`."
             ) from exc
 
-        # Keep it CPU-only by default for portability.
+        # CPU by default for portability; oneDNN/OpenVINO builds of onnxruntime are still CPU and get
+        # picked up ahead of the default provider when installed. With onnxruntime-gpu, TensorRT/CUDA
+        # come first and ORT places unsupported nodes on the CPU providers.
         sess_opts = ort.SessionOptions()
-        self._session = ort.InferenceSession(
-            self._path.as_posix(), sess_options=sess_opts, providers=["CPUExecutionProvider"]
-        )
+        sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if int(intra_op_num_threads) > 0:
+            # Several runs in flight (offline batches): cap per-run threads to avoid oversubscription.
+            sess_opts.intra_op_num_threads = int(intra_op_num_threads)
+        available = set(ort.get_available_providers())
+        cpu_providers = [p for p in _CPU_PROVIDERS if p in available] + ["CPUExecutionProvider"]
+        gpu_providers = _gpu_providers(available, self._path)
+        providers = gpu_providers + cpu_providers
+
+        self._session = None
+        if gpu_providers:
+            # GPU runs the fp32 graph (dynamic INT8 is a CPU optimization); if the GPU stack fails to
+            # initialize (missing CUDA/TensorRT libraries), fall through to the CPU path below.
+            try:
+                self._session = ort.InferenceSession(self._path.as_posix(), sess_options=sess_opts, providers=providers)
+                if not any(p in _GPU_PROVIDERS for p in self._session.get_providers()):
+                    # ORT silently dropped the GPU providers: take the CPU path (and its INT8 model).
+                    self._session = None
+            except Exception:
+                self._session = None
+            providers = cpu_providers
+
+        # Prefer the INT8 export next to the fp32 model when it exists; fall back if it doesn't load.
+        int8_path = _quantized_path(self._path)
+        if self._session is None and int8_path.exists() and int8_path != self._path:
+            try:
+                self._session = ort.InferenceSession(int8_path.as_posix(), sess_options=sess_opts, providers=providers)
+                self._path = int8_path
+            except Exception:
+                self._session = None
+        if self._session is None:
+            self._session = ort.InferenceSession(self._path.as_posix(), sess_options=sess_opts, providers=providers)
 
         inputs = self._session.get_inputs()
         if not inputs:
             raise RuntimeError("ONNX model has no inputs.")
         self._input_name = str(inputs[0].name)
+        batch_dim = inputs[0].shape[0] if inputs[0].shape else None
+        self._fixed_batch: Optional[int] = int(batch_dim) if isinstance(batch_dim, int) else None
 
         outputs = self._session.get_outputs()
         self._output_name: Optional[str] = str(outputs[0].name) if outputs else None
@@ -50,7 +110,21 @@ class OnnxModel:
             x = x[None, :, :]
         if x.ndim != 3:
             raise ValueError(f"Expected log_mel with shape (n_mels, n_frames) or (1, n_mels, n_frames); got {x.shape}")
+        return float(self._run(x)[0])
 
+    def predict_batch(self, log_mels: np.ndarray) -> np.ndarray:
+        x = log_mels.astype(np.float32, copy=False)
+        if x.ndim != 3:
+            raise ValueError(f"Expected log_mels with shape (batch, n_mels, n_frames); got {x.shape}")
+        if x.shape[0] == 0:
+            return np.zeros((0,), dtype=np.float32)
+        if self._fixed_batch is not None and int(x.shape[0]) != self._fixed_batch:
+            # Model exported with a static batch dimension: fall back to one run per window.
+            return np.concatenate([self._run(x[i : i + 1]) for i in range(int(x.shape[0]))])
+        return self._run(x)
+
+    def _run(self, x: np.ndarray) -> np.ndarray:
+        batch = int(x.shape[0])
         outputs = self._session.run(
             None if self._output_name is None else [self._output_name],
             {self._input_name: x},
@@ -62,18 +136,14 @@ class OnnxModel:
         y = y.astype(np.float32, copy=False)
 
         # Accept a few common heads:
-        # - probability scalar (sigmoid): (1,) or (1,1)
-        # - logits/probs for 2 classes: (1,2) -> take index 1 as 'fake'
-        if y.size == 1:
-            p = float(y.reshape(-1)[0])
-            return float(np.clip(p, 0.0, 1.0))
-
-        if y.ndim >= 1 and y.shape[-1] == 2:
+        # - probability scalar (sigmoid): (B,) or (B,1)
+        # - logits/probs for 2 classes: (B,2) -> take index 1 as 'fake'
+        if y.size == batch:
+            p = y.reshape(-1)
+        elif y.ndim >= 1 and y.shape[-1] == 2:
             probs = _softmax(y, axis=-1)
-            p = float(probs.reshape(-1, 2)[0, 1])
-            return float(np.clip(p, 0.0, 1.0))
-
-        # Fallback: take first element and clamp.
-        p = float(y.reshape(-1)[0])
-        return float(np.clip(p, 0.0, 1.0))
-
+            p = probs.reshape(batch, -1, 2)[:, 0, 1]
+        else:
+            # Fallback: take first element per item and clamp.
+            p = y.reshape(batch, -1)[:, 0]
+        return np.clip(p, 0.0, 1.0).astype(np.float32, copy=False)
@@ -15,11 +15,15 @@ def to_mono(audio: np.ndarray) -> np.ndarray:
 
 def normalize_audio(audio: np.ndarray, peak: float = 0.99) -> np.ndarray:
     audio = audio.astype(np.float32, copy=False)
-    audio = audio - float(np.mean(audio)) if audio.size else audio
-    max_abs = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if audio.size == 0:
+        return audio
+    # One output buffer: center into a new array, then scale it in place.
+    audio = audio - np.float32(np.mean(audio))
+    max_abs = float(max(np.max(audio), -np.min(audio)))
     if max_abs <= 0:
         return audio
-    return (audio / max_abs) * float(peak)
+    audio *= np.float32(float(peak) / max_abs)
+    return audio
 
 
 def preprocess_audio(
@@ -15,6 +15,8 @@ def _dt_slug() -> str:
 
 def analysis_to_dict(analysis: AnalysisResult) -> dict[str, Any]:
     d = asdict(analysis)
+    # Column arrays duplicate `windows` and are not JSON-serializable.
+    d.pop("arrays", None)
     # Make floats JSON-friendly (NaN -> None).
     for w in d.get("windows", []):
         result = w.get("result", {})
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class InferenceResult:
@@ -19,3 +21,13 @@ class WindowScore:
     t_end: float
     result: InferenceResult
 
+
+@dataclass(frozen=True)
+class WindowScoreArrays:
+    # Column view of a window list (one entry per window, same order) for statistics and plotting.
+    t_start: np.ndarray
+    t_end: np.ndarray
+    p_fake: np.ndarray  # NaN for non-speech windows
+    p_fake_smooth: np.ndarray
+    confidence: np.ndarray
+    is_speech: np.ndarray  # bool
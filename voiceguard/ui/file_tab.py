@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, QThread, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QFormLayout,
@@ -30,25 +34,165 @@ from voiceguard.reports import (
     write_json_report,
 )
 from voiceguard.ui.presentation import Verdict, format_percent, make_verdict
-from voiceguard.ui.widgets.timeline import TimeSegment, TimelineWidget
-
+from voiceguard.ui.warmup import BackendWarmupRunnable
+from voiceguard.ui.widgets.timeline import TimelineWidget
+
+
+@dataclass(frozen=True)
+class _PresentationBundle:
+    # Everything _on_finished shows, formatted on the worker thread so the UI only calls setText.
+    backend_label: str
+    backend_note: str
+    p_mean: str
+    p_max: str
+    fake_fraction: str
+    conf_mean: str
+    speech_windows: str
+    chip_duration: str
+    chip_speech: str
+    chip_alerts: str
+    prob_text: str
+    prob_tone: Optional[str]
+    verdict_title: str
+    verdict_subtitle: str
+    times: np.ndarray
+    values: np.ndarray
+    segments: np.ndarray  # (N, 2) start/end seconds
+    segment_lines: list[str]
+
+
+def _build_presentation(analysis: AnalysisResult, *, threshold: float) -> _PresentationBundle:
+    summary = analysis.summary
+    backend = str(analysis.backend).lower()
+    if backend == "onnx":
+        backend_label = "ML модель (ONNX)"
+    elif backend == "hf":
+        backend_label = "ML модель (HuggingFace)"
+    else:
+        backend_label = "Демо (эвристика)"
+    backend_note = str(analysis.backend_note) if analysis.backend_note else ""
+    if backend not in {"onnx", "hf"} and not backend_note:
+        backend_note = "Для максимальной точности подключите ML‑модель (HF/ONNX)."
+
+    has_speech = int(summary.speech_windows) > 0
+    if has_speech:
+        p_mean = format_percent(float(summary.p_fake_mean))
+        p_max = format_percent(float(summary.p_fake_max))
+        fake_fraction = format_percent(float(getattr(summary, "fake_fraction", 0.0)))
+        conf_mean = format_percent(float(summary.confidence_mean))
+    else:
+        p_mean = p_max = fake_fraction = conf_mean = "—"
+
+    if not has_speech:
+        prob_text = "—"
+        prob_tone: Optional[str] = None
+        verdict_title = "Речь не обнаружена"
+        verdict_subtitle = (
+            "Файл слишком тихий или содержит в основном музыку/шум. Попробуйте другой фрагмент или увеличьте громкость."
+        )
+    else:
+        p_overall = float(summary.p_fake_overall)
+        verdict = make_verdict(
+            p_overall,
+            confidence=float(summary.confidence_mean),
+            threshold=float(threshold),
+        )
 
-class _FileAnalyzeWorker(QObject):
-    progress = Signal(int, int)  # done, total
-    finished = Signal(object)  # AnalysisResult
+        # If overall looks "real", but there are sustained high-risk segments,
+        # show a cautionary verdict to avoid missing partial impersonation.
+        if summary.alert_segments and p_overall < float(threshold) * 0.60:
+            verdict = Verdict(
+                title="В записи есть подозрительные фрагменты (возможен ИИ)",
+                subtitle="В целом запись может быть реальной, но отдельные сегменты выглядят как сгенерированные ИИ. Проверьте таймлайн.",
+                color="#f59e0b",  # amber-500
+                tone="amber",
+            )
+        prob_text = format_percent(p_overall)
+        prob_tone = verdict.tone
+        verdict_title = verdict.title
+        verdict_subtitle = verdict.subtitle
+
+    speech_windows = f"{summary.speech_windows}/{summary.total_windows}"
+    arrays = analysis.arrays
+    # NaN breaks the timeline line; non-speech windows already carry NaN p_fake.
+    values = np.where(arrays.is_speech, arrays.p_fake, np.nan)
+
+    return _PresentationBundle(
+        backend_label=backend_label,
+        backend_note=backend_note,
+        p_mean=p_mean,
+        p_max=p_max,
+        fake_fraction=fake_fraction,
+        conf_mean=conf_mean,
+        speech_windows=speech_windows,
+        chip_duration=f"Длительность: {summary.duration_sec:.1f}s",
+        chip_speech=f"Речь: {speech_windows}",
+        chip_alerts=f"Алерты: {len(summary.alert_segments)}",
+        prob_text=prob_text,
+        prob_tone=prob_tone,
+        verdict_title=verdict_title,
+        verdict_subtitle=verdict_subtitle,
+        times=arrays.t_end,
+        values=values,
+        segments=np.array(
+            [(s.start_sec, s.end_sec) for s in summary.alert_segments], dtype=np.float64
+        ).reshape(-1, 2),
+        segment_lines=[f"{s.start_sec:.2f}s — {s.end_sec:.2f}s" for s in summary.alert_segments] or ["—"],
+    )
+
+
+_AUDIO_EXTENSIONS = (".wav", ".flac", ".mp3", ".ogg", ".m4a", ".aiff", ".aif")
+
+
+def _first_audio_path(urls: list) -> Optional[Path]:  # noqa: ANN001
+    for url in urls:
+        if url.isLocalFile():
+            local = url.toLocalFile()
+            if local.lower().endswith(_AUDIO_EXTENSIONS):
+                return Path(local)
+    return None
+
+
+class _AnalysisCancelled(Exception):
+    pass
+
+
+class _FileAnalyzeSignals(QObject):
+    progress = Signal(int)  # percent, -1 when the total is unknown
+    finished = Signal(object, object)  # AnalysisResult, _PresentationBundle
     error = Signal(str)
+    cancelled = Signal()
 
-    def __init__(self, *, path: Path, config: AppConfig) -> None:
+
+class _FileAnalyzeRunnable(QRunnable):
+    # Runs on the shared QThreadPool; created on the GUI thread, so `signals` lives there
+    # and every emit from the pool thread is delivered as a queued call.
+    def __init__(self, *, path: Path, config: AppConfig, cancel: threading.Event) -> None:
         super().__init__()
+        self.signals = _FileAnalyzeSignals()
         self._path = Path(path)
         self._config = config
+        self._cancel = cancel
+        self._last_pct = -2
+        self._last_emit_ns = 0
 
     def run(self) -> None:
         try:
-            audio, sr = load_audio_file(self._path)
+            # Mixed down to mono while decoding: analysis only needs one channel.
+            audio, sr = load_audio_file(self._path, mono=True)
+            if self._cancel.is_set():
+                raise _AnalysisCancelled()
 
             def on_progress(done: int, total: int) -> None:
-                self.progress.emit(int(done), int(total))
+                if self._cancel.is_set():
+                    raise _AnalysisCancelled()
+                # At most one queued event per percent step (and per 20 ms) crosses to the GUI thread.
+                pct = int(done) * 100 // int(total) if total > 0 else -1
+                now = time.monotonic_ns()
+                if pct != self._last_pct and now - self._last_emit_ns > 20_000_000:
+                    self._last_pct = pct
+                    self._last_emit_ns = now
+                    self.signals.progress.emit(pct)
 
             analysis = analyze_audio(
                 audio=audio,
@@ -58,9 +202,16 @@ class _FileAnalyzeWorker(QObject):
                 source=str(self._path),
                 progress=on_progress,
             )
-            self.finished.emit(analysis)
+            bundle = _build_presentation(analysis, threshold=float(self._config.alert_threshold))
+            self.signals.finished.emit(analysis, bundle)
+        except _AnalysisCancelled:
+            self.signals.cancelled.emit()
+        except FileNotFoundError:
+            self.signals.error.emit(f"Файл не найден: {self._path}")
+        except OSError as exc:
+            self.signals.error.emit(f"Не удалось открыть файл: {self._path}\n{exc.strerror or exc}")
         except Exception as exc:
-            self.error.emit(str(exc))
+            self.signals.error.emit(str(exc))
 
 
 class FileTab(QWidget):
@@ -69,8 +220,9 @@ class FileTab(QWidget):
         self._config = config
         self._analysis: Optional[AnalysisResult] = None
 
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[_FileAnalyzeWorker] = None
+        self._busy = False
+        self._cancel = threading.Event()
+        self._signals: Optional[_FileAnalyzeSignals] = None
 
         self.setAcceptDrops(True)
 
@@ -88,7 +240,7 @@ class FileTab(QWidget):
 
         self._prob_big = QLabel("—")
         self._prob_big.setProperty("tone", "hero")
-        self._set_prob_style()
+        self._prob_big.setStyleSheet("font-size: 42px; font-weight: 800;")
         header_layout.addWidget(self._prob_big)
 
         self._verdict_title = QLabel("Выберите файл для анализа")
@@ -181,12 +333,22 @@ class FileTab(QWidget):
         note.setProperty("muted", True)
         layout.addWidget(note)
 
-    def _set_prob_style(self, color: Optional[str] = None) -> None:
-        base = "font-size: 42px; font-weight: 800;"
-        if color:
-            self._prob_big.setStyleSheet(f"{base} color: {color};")
-        else:
-            self._prob_big.setStyleSheet(base)
+        # Load the model once the window is up, not on the first click.
+        QTimer.singleShot(0, self._warm_backend)
+
+    def _warm_backend(self) -> None:
+        QThreadPool.globalInstance().start(BackendWarmupRunnable(self._config, source_kind="file"))
+
+    def _set_prob_style(self, tone: Optional[str] = None) -> None:
+        # Verdict colors are theme selectors on the "tone" property: switching it only re-polishes
+        # the label instead of re-parsing a per-call stylesheet.
+        tone = tone or "hero"
+        if self._prob_big.property("tone") == tone:
+            return
+        self._prob_big.setProperty("tone", tone)
+        style = self._prob_big.style()
+        style.unpolish(self._prob_big)
+        style.polish(self._prob_big)
 
     def _browse(self) -> None:
         path_str, _ = QFileDialog.getOpenFileName(
@@ -199,7 +361,10 @@ class FileTab(QWidget):
             self._path_edit.setText(path_str)
 
     def _start_analysis(self) -> None:
-        if self._thread is not None:
+        if self._busy:
+            # Second click while running cancels; the runnable stops at its next progress report.
+            self._cancel.set()
+            self._analyze_btn.setEnabled(False)
             return
 
         path_str = self._path_edit.text().strip()
@@ -209,10 +374,8 @@ class FileTab(QWidget):
         if not path_str:
             return
 
+        # No stat here (it can block on network mounts): the worker reports a missing file.
         path = Path(path_str)
-        if not path.exists():
-            QMessageBox.warning(self, "VoiceGuard", f"Файл не найден: {path}")
-            return
 
         self._analysis = None
         self._export_btn.setEnabled(False)
@@ -225,133 +388,84 @@ class FileTab(QWidget):
 
         self._progress.setVisible(True)
         self._progress.setValue(0)
-        self._analyze_btn.setEnabled(False)
-
-        self._thread = QThread(self)
-        self._worker = _FileAnalyzeWorker(path=path, config=self._config)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self._on_progress)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-
-        self._worker.error.connect(self._thread.quit)
-        self._worker.error.connect(self._worker.deleteLater)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.finished.connect(self._on_thread_finished)
-
-        self._thread.start()
-
-    def _on_progress(self, done: int, total: int) -> None:
-        if total <= 0:
+        self._analyze_btn.setText("Отменить")
+
+        self._busy = True
+        self._cancel = threading.Event()
+        runnable = _FileAnalyzeRunnable(path=path, config=self._config, cancel=self._cancel)
+        signals = runnable.signals
+        signals.progress.connect(self._on_progress)
+        signals.finished.connect(self._on_finished)
+        signals.error.connect(self._on_error)
+        signals.finished.connect(self._on_analysis_done)
+        signals.error.connect(self._on_analysis_done)
+        signals.cancelled.connect(self._on_analysis_done)
+        # The pool owns the runnable; keep the bridge alive until its last signal is delivered.
+        self._signals = signals
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_progress(self, pct: int) -> None:
+        if pct < 0:
             self._progress.setRange(0, 0)
             return
         self._progress.setRange(0, 100)
-        self._progress.setValue(int(done * 100 / total))
+        self._progress.setValue(pct)
 
     def _on_error(self, message: str) -> None:
         QMessageBox.critical(self, "VoiceGuard", message or "Неизвестная ошибка")
 
-    def _on_finished(self, analysis_obj: object) -> None:
+    def _on_finished(self, analysis_obj: object, bundle_obj: object = None) -> None:
         analysis = analysis_obj if isinstance(analysis_obj, AnalysisResult) else None
         if analysis is None:
             QMessageBox.critical(self, "VoiceGuard", "Internal error: invalid analysis result.")
             return
+        bundle = bundle_obj if isinstance(bundle_obj, _PresentationBundle) else None
+        if bundle is None:
+            bundle = _build_presentation(analysis, threshold=float(self._config.alert_threshold))
 
         self._analysis = analysis
-        backend = str(analysis.backend).lower()
-        if backend == "onnx":
-            backend_label = "ML модель (ONNX)"
-        elif backend == "hf":
-            backend_label = "ML модель (HuggingFace)"
-        else:
-            backend_label = "Демо (эвристика)"
-        self._backend.setText(backend_label)
-        self._chip_backend.setText(f"Режим: {backend_label}")
-        backend_note = str(analysis.backend_note) if analysis.backend_note else ""
-        if backend not in {"onnx", "hf"} and not backend_note:
-            backend_note = "Для максимальной точности подключите ML‑модель (HF/ONNX)."
-        self._backend_note.setText(backend_note)
-        has_speech = int(analysis.summary.speech_windows) > 0
-        if has_speech:
-            self._p_mean.setText(format_percent(float(analysis.summary.p_fake_mean)))
-            self._p_max.setText(format_percent(float(analysis.summary.p_fake_max)))
-            self._fake_fraction.setText(format_percent(float(getattr(analysis.summary, "fake_fraction", 0.0))))
-            self._conf_mean.setText(format_percent(float(analysis.summary.confidence_mean)))
-        else:
-            self._p_mean.setText("—")
-            self._p_max.setText("—")
-            self._fake_fraction.setText("—")
-            self._conf_mean.setText("—")
-
-        self._speech_windows.setText(f"{analysis.summary.speech_windows}/{analysis.summary.total_windows}")
-        self._chip_duration.setText(f"Длительность: {analysis.summary.duration_sec:.1f}s")
-        self._chip_speech.setText(
-            f"Речь: {analysis.summary.speech_windows}/{analysis.summary.total_windows}"
-        )
-        self._chip_alerts.setText(f"Алерты: {len(analysis.summary.alert_segments)}")
-
-        if not has_speech:
-            self._prob_big.setText("—")
-            self._set_prob_style()
-            self._verdict_title.setText("Речь не обнаружена")
-            self._verdict_subtitle.setText(
-                "Файл слишком тихий или содержит в основном музыку/шум. Попробуйте другой фрагмент или увеличьте громкость."
-            )
-        else:
-            p_overall = float(analysis.summary.p_fake_overall)
-            verdict = make_verdict(
-                p_overall,
-                confidence=float(analysis.summary.confidence_mean),
-                threshold=float(self._config.alert_threshold),
-            )
+        # Freeze painting while the labels and alert list change: one relayout and repaint at the end
+        # instead of one per setText.
+        self.setUpdatesEnabled(False)
+        try:
+            self._backend.setText(bundle.backend_label)
+            self._chip_backend.setText(f"Режим: {bundle.backend_label}")
+            self._backend_note.setText(bundle.backend_note)
+            self._p_mean.setText(bundle.p_mean)
+            self._p_max.setText(bundle.p_max)
+            self._fake_fraction.setText(bundle.fake_fraction)
+            self._conf_mean.setText(bundle.conf_mean)
+
+            self._speech_windows.setText(bundle.speech_windows)
+            self._chip_duration.setText(bundle.chip_duration)
+            self._chip_speech.setText(bundle.chip_speech)
+            self._chip_alerts.setText(bundle.chip_alerts)
+
+            self._prob_big.setText(bundle.prob_text)
+            self._set_prob_style(bundle.prob_tone)
+            self._verdict_title.setText(bundle.verdict_title)
+            self._verdict_subtitle.setText(bundle.verdict_subtitle)
+
+            self._segments.clear()
+            self._segments.addItems(bundle.segment_lines)
+            self._export_btn.setEnabled(True)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.layout().activate()
 
-            # If overall looks "real", but there are sustained high-risk segments,
-            # show a cautionary verdict to avoid missing partial impersonation.
-            if analysis.summary.alert_segments and p_overall < float(self._config.alert_threshold) * 0.60:
-                verdict = Verdict(
-                    title="В записи есть подозрительные фрагменты (возможен ИИ)",
-                    subtitle="В целом запись может быть реальной, но отдельные сегменты выглядят как сгенерированные ИИ. Проверьте таймлайн.",
-                    color="#f59e0b",  # amber-500
-                )
-
-            self._prob_big.setText(format_percent(p_overall))
-            self._set_prob_style(verdict.color)
-            self._verdict_title.setText(verdict.title)
-            self._verdict_subtitle.setText(verdict.subtitle)
-
-        times: list[float] = []
-        values: list[Optional[float]] = []
-        for w in analysis.windows:
-            times.append(float(w.t_end))
-            v = float(w.result.p_fake)
-            values.append(None if (not w.result.is_speech or v != v) else v)
-
-        segments = [TimeSegment(start_sec=s.start_sec, end_sec=s.end_sec) for s in analysis.summary.alert_segments]
         self._timeline.set_data(
-            times=times,
-            values=values,
+            times=bundle.times,
+            values=bundle.values,
             threshold=float(self._config.alert_threshold),
-            segments=segments,
+            segments=bundle.segments,
         )
 
-        self._segments.clear()
-        if analysis.summary.alert_segments:
-            for seg in analysis.summary.alert_segments:
-                self._segments.addItem(f"{seg.start_sec:.2f}s — {seg.end_sec:.2f}s")
-        else:
-            self._segments.addItem("—")
-
-        self._export_btn.setEnabled(True)
-
-    def _on_thread_finished(self) -> None:
+    def _on_analysis_done(self, *_: object) -> None:
         self._progress.setVisible(False)
+        self._analyze_btn.setText("Проверить")
         self._analyze_btn.setEnabled(True)
-        self._thread = None
-        self._worker = None
+        self._busy = False
+        self._signals = None
 
     def _export_report(self) -> None:
         if self._analysis is None:
@@ -387,13 +501,18 @@ class FileTab(QWidget):
         QMessageBox.information(self, "VoiceGuard", f"Сохранено: {path}")
 
     def dragEnterEvent(self, event) -> None:  # noqa: ANN001
-        if event.mimeData().hasUrls():
+        # Decide here, so the OS shows a "no drop" cursor for anything we can't analyze.
+        if _first_audio_path(event.mimeData().urls()) is not None:
             event.acceptProposedAction()
+        else:
+            event.ignore()
 
     def dropEvent(self, event) -> None:  # noqa: ANN001
-        urls = event.mimeData().urls()
-        if not urls:
+        path = _first_audio_path(event.mimeData().urls())
+        if path is None:
+            event.ignore()
             return
-        path = urls[0].toLocalFile()
-        if path:
-            self._path_edit.setText(path)
+        event.acceptProposedAction()
+        self._path_edit.setText(str(path))
+        if not self._busy and path.exists():
+            self._start_analysis()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import queue
-from collections import deque
+import time
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QCheckBox,
@@ -33,20 +34,78 @@ from voiceguard.dsp.resample import resample_audio
 from voiceguard.engine import VoiceGuardEngine
 from voiceguard.types import InferenceResult
 from voiceguard.ui.presentation import format_percent, make_verdict
-from voiceguard.ui.widgets.timeline import TimeSegment, TimelineWidget
+from voiceguard.ui.warmup import BackendWarmupRunnable
+from voiceguard.ui.widgets.timeline import TimelineWidget
 from voiceguard.windowing import StreamWindowProcessor
 
 
+_TIMELINE_POINTS = 400
+
+_BACKEND_CHIPS = {"onnx": "ONNX", "hf": "HF", "heuristic": "Heuristic"}
+
+# PortAudio enumeration is slow; source switches and repeated "Обновить" clicks reuse a recent list.
+_DEVICES_TTL_SEC = 2.0
+_devices_cache: tuple[float, list[tuple[int, str, int, int, bool]]] = (float("-inf"), [])
+
+
+@lru_cache(maxsize=1)
+def _hostapi_info() -> tuple[dict[int, str], bool]:
+    # Host APIs are fixed for the life of the PortAudio session.
+    import sounddevice as sd  # type: ignore
+
+    try:
+        hostapis = sd.query_hostapis()
+    except Exception:
+        hostapis = []
+    names = {idx: str(api.get("name", "")) for idx, api in enumerate(hostapis)}
+    has_wasapi = bool(hasattr(sd, "WasapiSettings") and any("WASAPI" in name.upper() for name in names.values()))
+    return names, has_wasapi
+
+
+def _query_devices() -> list[tuple[int, str, int, int, bool]]:
+    # (index, name, max_input_channels, max_output_channels, is_wasapi) per device, extracted once.
+    global _devices_cache
+    stamp, devices = _devices_cache
+    now = time.monotonic()
+    if now - stamp < _DEVICES_TTL_SEC:
+        return devices
+    import sounddevice as sd  # type: ignore
+
+    hostapi_names, _ = _hostapi_info()
+    devices = [
+        (
+            idx,
+            str(dev.get("name", f"Device {idx}")),
+            int(dev.get("max_input_channels", 0)),
+            int(dev.get("max_output_channels", 0)),
+            "WASAPI" in hostapi_names.get(int(dev.get("hostapi", -1)), "").upper(),
+        )
+        for idx, dev in enumerate(sd.query_devices())
+    ]
+    _devices_cache = (now, devices)
+    return devices
+
+
 @dataclass(frozen=True)
 class _DeviceSpec:
     device: Optional[int]
     loopback: bool
 
 
+@dataclass(frozen=True, slots=True)
+class _LivePoint:
+    t_start: float
+    t_end: float
+    result: InferenceResult
+    alert: bool
+    # AlertTracker.segments_array: read-only (N, 2), the same object until a segment is added.
+    segments: np.ndarray
+
+
 class _LiveAnalyzerThread(QThread):
-    point = Signal(object)  # dict payload
+    point = Signal(_LivePoint)
     error = Signal(str)
-    status = Signal(str)
+    status = Signal(str, str)  # text, engine backend (onnx | hf | heuristic)
 
     def __init__(
         self,
@@ -61,6 +120,15 @@ class _LiveAnalyzerThread(QThread):
         self._source = str(source)
         self._device = device
         self._loopback = bool(loopback)
+        self._capture: Optional[MicCapture | SystemAudioCapture] = None
+
+    def stop(self) -> None:
+        # The loop blocks on the capture ring without a timeout (no idle wakeups); wake it so it
+        # sees the interruption request.
+        self.requestInterruption()
+        capture = self._capture
+        if capture is not None:
+            capture.queue.wake()
 
     def run(self) -> None:  # noqa: PLR0912
         target_sr = int(self._config.sample_rate)
@@ -70,6 +138,7 @@ class _LiveAnalyzerThread(QThread):
         else:
             capture = MicCapture(device=self._device)
             source_label = "микрофона"
+        self._capture = capture
 
         try:
             actual_sr = int(capture.start(preferred_sample_rate=target_sr, block_sec=0.10))
@@ -119,7 +188,7 @@ class _LiveAnalyzerThread(QThread):
             if parts:
                 enhance_status = " • Фокус: " + "+".join(parts)
 
-        self.status.emit(f"{source_status} • {sr_status} • {backend_status}{enhance_status}")
+        self.status.emit(f"{source_status} • {sr_status} • {backend_status}{enhance_status}", backend)
 
         alert = AlertTracker(
             threshold=float(self._config.alert_threshold),
@@ -127,22 +196,30 @@ class _LiveAnalyzerThread(QThread):
             step_sec=float(self._config.hop_sec),
         )
 
+        # Capture rings hand out float32 already; checked once per stream rather than per chunk.
+        needs_cast: Optional[bool] = None
+        sr_f = float(target_sr)
+        win_samples = int(processor.window_samples)
         try:
             while not self.isInterruptionRequested():
                 try:
-                    chunk = capture.queue.get(timeout=0.2)
+                    chunk = capture.queue.get()
                 except queue.Empty:
                     continue
 
-                samples = chunk.samples.astype(np.float32, copy=False)
+                if needs_cast is None:
+                    needs_cast = chunk.samples.dtype != np.float32
+                samples = np.asarray(chunk.samples, dtype=np.float32) if needs_cast else chunk.samples
                 if resample_needed and int(chunk.sample_rate) != int(target_sr):
                     samples = resample_audio(samples, orig_sr=int(chunk.sample_rate), target_sr=target_sr)
 
                 for w in processor.push(samples):
-                    t_start = float(w.start_sample) / float(target_sr)
-                    t_end = float(w.start_sample + processor.window_samples) / float(target_sr)
+                    # Divide (not multiply by 1/sr) so times match the offline analysis bit for bit.
+                    t_start = w.start_sample / sr_f
+                    t_end = (w.start_sample + win_samples) / sr_f
 
-                    result = engine.infer_window(w.samples, orig_sr=target_sr)
+                    # Silence only shows its level here, so the engine skips the spectral indicators for it.
+                    result = engine.infer_batch([w.samples], orig_sr=target_sr, silent_indicators=False)[0]
                     if result.is_speech:
                         is_alert = alert.update(
                             t_start=t_start,
@@ -154,13 +231,13 @@ class _LiveAnalyzerThread(QThread):
                         is_alert = alert.update(t_start=t_start, t_end=t_end, p=0.0, is_speech=False)
 
                     self.point.emit(
-                        {
-                            "t_start": t_start,
-                            "t_end": t_end,
-                            "result": result,
-                            "alert": bool(is_alert),
-                            "segments": alert.segments,
-                        }
+                        _LivePoint(
+                            t_start=t_start,
+                            t_end=t_end,
+                            result=result,
+                            alert=bool(is_alert),
+                            segments=alert.segments_array,
+                        )
                     )
         except Exception as exc:
             self.error.emit(str(exc))
@@ -174,12 +251,22 @@ class LiveTab(QWidget):
         self._config = config
         self._thread: Optional[_LiveAnalyzerThread] = None
 
-        self._times: "deque[float]" = deque(maxlen=400)  # ~100s at 0.25s hop
-        self._values: "deque[Optional[float]]" = deque(maxlen=400)
-        self._segments: list[TimeSegment] = []
+        # Timeline ring buffers (~100s at 0.25s hop); NaN value = no speech.
+        self._t_buf = np.zeros((_TIMELINE_POINTS,), dtype=np.float64)
+        self._v_buf = np.full((_TIMELINE_POINTS,), np.nan, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._segments = np.zeros((0, 2), dtype=np.float64)
         self._noise_floor_db: Optional[float] = None
         self._applying_profile = False
 
+        # Points arrive at the analysis rate; the UI repaints at most ~15 times per second.
+        self._pending: list[_LivePoint] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(66)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
@@ -253,7 +340,7 @@ class LiveTab(QWidget):
 
         self._prob_big = QLabel("—")
         self._prob_big.setProperty("tone", "hero")
-        self._set_prob_style()
+        self._prob_big.setStyleSheet("font-size: 42px; font-weight: 800;")
         header_layout.addWidget(self._prob_big)
 
         self._verdict_title = QLabel("Нажмите «Старт»")
@@ -355,6 +442,7 @@ class LiveTab(QWidget):
 
         layout.addWidget(QLabel("Почему так (простые индикаторы):"))
         self._reasons = QListWidget()
+        self._shown_reasons: list[str] = []
         layout.addWidget(self._reasons)
 
         self._note_label = QLabel()
@@ -367,12 +455,16 @@ class LiveTab(QWidget):
         self._sync_enhance_controls()
         self._update_focus_chip()
         self._update_source_texts()
+        QTimer.singleShot(0, self._warm_backend)
+
+    def _warm_backend(self) -> None:
+        QThreadPool.globalInstance().start(BackendWarmupRunnable(self._config, source_kind="mic"))
 
     def _refresh_devices(self) -> None:
         self._device_combo.clear()
         source = self._current_source()
         try:
-            import sounddevice as sd  # type: ignore
+            import sounddevice  # type: ignore  # noqa: F401
         except Exception:
             self._device_combo.addItem("sounddevice недоступен", None)
             self._device_combo.setEnabled(False)
@@ -382,49 +474,23 @@ class LiveTab(QWidget):
         self._device_combo.setEnabled(True)
         self._start_btn.setEnabled(True)
 
-        try:
-            hostapis = sd.query_hostapis()
-        except Exception:
-            hostapis = []
-
-        hostapi_names = {idx: str(api.get("name", "")) for idx, api in enumerate(hostapis)}
-        has_wasapi = bool(
-            hasattr(sd, "WasapiSettings")
-            and any("WASAPI" in name.upper() for name in hostapi_names.values())
-        )
-        self._loopback_available = bool(source == "system" and has_wasapi)
-
-        default_loopback = bool(source == "system" and has_wasapi)
-        self._device_combo.addItem("По умолчанию", _DeviceSpec(device=None, loopback=default_loopback))
+        _, has_wasapi = _hostapi_info()
+        loopback = bool(source == "system" and has_wasapi)
+        self._loopback_available = loopback
+        self._device_combo.addItem("По умолчанию", _DeviceSpec(device=None, loopback=loopback))
 
         try:
-            devices = sd.query_devices()
+            devices = _query_devices()
         except Exception:
             return
 
-        for idx, dev in enumerate(devices):
-            try:
-                if source == "mic":
-                    if int(dev.get("max_input_channels", 0)) <= 0:
-                        continue
-                    name = str(dev.get("name", f"Device {idx}"))
-                    self._device_combo.addItem(f"{idx}: {name}", _DeviceSpec(device=int(idx), loopback=False))
-                else:
-                    if has_wasapi:
-                        if int(dev.get("max_output_channels", 0)) <= 0:
-                            continue
-                        hostapi_name = hostapi_names.get(int(dev.get("hostapi", -1)), "")
-                        if "WASAPI" not in str(hostapi_name).upper():
-                            continue
-                        name = str(dev.get("name", f"Device {idx}"))
-                        self._device_combo.addItem(f"{idx}: {name}", _DeviceSpec(device=int(idx), loopback=True))
-                    else:
-                        if int(dev.get("max_input_channels", 0)) <= 0:
-                            continue
-                        name = str(dev.get("name", f"Device {idx}"))
-                        self._device_combo.addItem(f"{idx}: {name}", _DeviceSpec(device=int(idx), loopback=False))
-            except Exception:
-                continue
+        if loopback:
+            # WASAPI loopback records from output devices.
+            picked = [(idx, name) for idx, name, _, n_out, is_wasapi in devices if n_out > 0 and is_wasapi]
+        else:
+            picked = [(idx, name) for idx, name, n_in, _, _ in devices if n_in > 0]
+        for idx, name in picked:
+            self._device_combo.addItem(f"{idx}: {name}", _DeviceSpec(device=idx, loopback=loopback))
 
     def _current_source(self) -> str:
         data = self._source_combo.currentData()
@@ -546,12 +612,16 @@ class LiveTab(QWidget):
         label = "+".join(parts) if parts else "on"
         self._chip_focus.setText(f"Фокус: {label}")
 
-    def _set_prob_style(self, color: Optional[str] = None) -> None:
-        base = "font-size: 42px; font-weight: 800;"
-        if color:
-            self._prob_big.setStyleSheet(f"{base} color: {color};")
-        else:
-            self._prob_big.setStyleSheet(base)
+    def _set_prob_style(self, tone: Optional[str] = None) -> None:
+        # Verdict colors are theme selectors on the "tone" property: switching it only re-polishes
+        # the label instead of re-parsing a per-call stylesheet.
+        tone = tone or "hero"
+        if self._prob_big.property("tone") == tone:
+            return
+        self._prob_big.setProperty("tone", tone)
+        style = self._prob_big.style()
+        style.unpolish(self._prob_big)
+        style.polish(self._prob_big)
 
     def _toggle(self) -> None:
         if self._thread is None:
@@ -566,11 +636,14 @@ class LiveTab(QWidget):
         device_spec = self._selected_device()
         live_config = self._build_live_config()
 
-        self._times.clear()
-        self._values.clear()
-        self._segments = []
+        self._flush_timer.stop()
+        self._pending = []
+        self._head = 0
+        self._count = 0
+        self._segments = np.zeros((0, 2), dtype=np.float64)
         self._timeline.clear()
         self._reasons.clear()
+        self._shown_reasons = []
         self._noise_floor_db = None
 
         self._thread = _LiveAnalyzerThread(
@@ -597,11 +670,14 @@ class LiveTab(QWidget):
         if self._thread is None:
             return
         self._start_btn.setEnabled(False)
-        self._thread.requestInterruption()
+        self._thread.stop()
         self._thread.wait(1500)
         # If it still didn't stop, let Qt finish it; UI state updates in _on_stopped.
 
     def _on_stopped(self) -> None:
+        # Points queued before the thread finished still land on the timeline.
+        self._flush_timer.stop()
+        self._flush_pending()
         self._start_btn.setEnabled(True)
         self._start_btn.setText("Старт")
         self._source_combo.setEnabled(True)
@@ -619,16 +695,9 @@ class LiveTab(QWidget):
         self._snr_label.setText("—")
         self._speech_label.setText("—")
 
-    def _on_status(self, text: str) -> None:
+    def _on_status(self, text: str, backend: str) -> None:
         self._status_label.setText(text)
-        backend = "—"
-        if "ONNX" in text:
-            backend = "ONNX"
-        elif "HuggingFace" in text:
-            backend = "HF"
-        elif "Демо" in text or "эвристика" in text:
-            backend = "Heuristic"
-        self._chip_backend.setText(f"Режим: {backend}")
+        self._chip_backend.setText(f"Режим: {_BACKEND_CHIPS.get(backend, '—')}")
 
     def _show_routing_help(self) -> None:
         QMessageBox.information(
@@ -644,38 +713,62 @@ class LiveTab(QWidget):
         QMessageBox.critical(self, "VoiceGuard", message or "Неизвестная ошибка")
         self._on_stopped()
 
-    def _on_point(self, payload: object) -> None:
-        if not isinstance(payload, dict):
-            return
-        result = payload.get("result")
-        if not isinstance(result, InferenceResult):
+    def _on_point(self, payload: _LivePoint) -> None:
+        self._pending.append(payload)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _ordered_series(self) -> tuple[np.ndarray, np.ndarray]:
+        # Oldest-first (times, values); views until the ring wraps, then one copy each.
+        if self._count < _TIMELINE_POINTS:
+            return self._t_buf[: self._count], self._v_buf[: self._count]
+        h = self._head
+        return (
+            np.concatenate((self._t_buf[h:], self._t_buf[:h])),
+            np.concatenate((self._v_buf[h:], self._v_buf[:h])),
+        )
+
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
             return
 
-        t_end = float(payload.get("t_end", 0.0))
-        self._times.append(t_end)
-        v = float(result.p_fake_smooth)
-        self._values.append(None if (not result.is_speech or v != v) else v)
+        # Every point feeds the series and the noise floor; the widgets show the newest one.
+        for item in pending:
+            item_result = item.result
+            self._t_buf[self._head] = item.t_end
+            self._v_buf[self._head] = float(item_result.p_fake_smooth) if item_result.is_speech else np.nan
+            self._head = (self._head + 1) % _TIMELINE_POINTS
+            self._count = min(self._count + 1, _TIMELINE_POINTS)
+            level = float(item_result.indicators.get("rms_db", float("nan")))
+            if not item_result.is_speech and level == level:
+                if self._noise_floor_db is None:
+                    self._noise_floor_db = float(level)
+                else:
+                    self._noise_floor_db = 0.90 * float(self._noise_floor_db) + 0.10 * float(level)
+
+        payload = pending[-1]
+        result = payload.result
+        t_end = payload.t_end
 
         # Update segments (last state).
-        segs = payload.get("segments", [])
-        self._segments = [TimeSegment(start_sec=s.start_sec, end_sec=s.end_sec) for s in segs] if segs else []
+        self._segments = payload.segments
 
+        times, values = self._ordered_series()
         self._timeline.set_data(
-            times=list(self._times),
-            values=list(self._values),
+            times=times,
+            values=values,
             threshold=float(self._threshold_spin.value()),
             segments=self._segments,
         )
 
         window_sec = 30.0
-        recent_vals = [
-            float(val)
-            for t, val in zip(self._times, self._values)
-            if val is not None and float(t) >= float(t_end - window_sec)
-        ]
-        if recent_vals:
-            avg = float(sum(recent_vals)) / float(len(recent_vals))
-            peak = float(max(recent_vals))
+        # Times are increasing, so the last 30 s are a tail slice.
+        recent_vals = values[int(np.searchsorted(times, float(t_end - window_sec), side="left")) :]
+        recent_vals = recent_vals[~np.isnan(recent_vals)]
+        if recent_vals.size:
+            avg = float(np.mean(recent_vals))
+            peak = float(np.max(recent_vals))
             self._avg_label.setText(format_percent(avg))
             self._peak_label.setText(format_percent(peak))
         else:
@@ -683,12 +776,6 @@ class LiveTab(QWidget):
             self._peak_label.setText("—")
 
         rms_db = float(result.indicators.get("rms_db", float("nan")))
-        if not result.is_speech and rms_db == rms_db:
-            if self._noise_floor_db is None:
-                self._noise_floor_db = float(rms_db)
-            else:
-                self._noise_floor_db = 0.90 * float(self._noise_floor_db) + 0.10 * float(rms_db)
-
         if rms_db == rms_db:
             self._signal_label.setText(f"{rms_db:.0f} dB")
         else:
@@ -722,17 +809,16 @@ class LiveTab(QWidget):
                 threshold=float(self._threshold_spin.value()),
             )
             self._prob_big.setText(format_percent(p))
-            self._set_prob_style(verdict.color)
+            self._set_prob_style(verdict.tone)
             self._verdict_title.setText(verdict.title)
             self._verdict_subtitle.setText(verdict.subtitle)
 
             self._conf_label.setText(format_percent(float(result.confidence)))
-            is_alert = bool(payload.get("alert", False))
+            is_alert = payload.alert
             self._alert_label.setText("АКТИВНО" if is_alert else "—")
 
-        self._reasons.clear()
-        if result.reasons:
-            for r in result.reasons[:6]:
-                self._reasons.addItem(str(r))
-        else:
-            self._reasons.addItem("—")
+        reasons = [str(r) for r in result.reasons[:6]] or ["—"]
+        if reasons != self._shown_reasons:
+            self._shown_reasons = reasons
+            self._reasons.clear()
+            self._reasons.addItems(reasons)
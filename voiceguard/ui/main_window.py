@@ -2,18 +2,17 @@ from __future__ import annotations
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QActionGroup
-from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QTabWidget
+from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QTabWidget, QVBoxLayout, QWidget
 
 from voiceguard.config import AppConfig
 from voiceguard.ui.file_tab import FileTab
-from voiceguard.ui.live_tab import LiveTab
 from voiceguard.ui.theme import THEME_DARK, THEME_LIGHT, apply_theme, load_theme_preference, save_theme_preference
-from voiceguard.ui.widgets.timeline import TimelineWidget
 
 
 class MainWindow(QMainWindow):
     def __init__(self, config: AppConfig) -> None:
         super().__init__()
+        self._config = config
         self.setWindowTitle("VoiceGuard — защита от имитации голоса")
         self._theme_mode = load_theme_preference()
 
@@ -24,7 +23,13 @@ class MainWindow(QMainWindow):
         tabs.setElideMode(Qt.TextElideMode.ElideRight)
 
         tabs.addTab(FileTab(config=config), "Файл")
-        tabs.addTab(LiveTab(config=config), "Онлайн")
+        # The live tab (PortAudio device scan, backend warm-up) is built the first time it is opened.
+        self._live_host = QWidget()
+        QVBoxLayout(self._live_host).setContentsMargins(0, 0, 0, 0)
+        self._live_built = False
+        tabs.addTab(self._live_host, "Онлайн")
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self._tabs = tabs
 
         self.setCentralWidget(tabs)
 
@@ -50,6 +55,14 @@ class MainWindow(QMainWindow):
         about = help_menu.addAction("О VoiceGuard")
         about.triggered.connect(self._show_about)
 
+    def _on_tab_changed(self, index: int) -> None:
+        if self._live_built or self._tabs.widget(index) is not self._live_host:
+            return
+        self._live_built = True
+        from voiceguard.ui.live_tab import LiveTab
+
+        self._live_host.layout().addWidget(LiveTab(config=self._config))
+
     def _show_about(self) -> None:
         QMessageBox.information(
             self,
@@ -67,5 +80,3 @@ class MainWindow(QMainWindow):
         app = QApplication.instance()
         if app is not None:
             apply_theme(app, mode)
-        for timeline in self.findChildren(TimelineWidget):
-            timeline.update()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -9,12 +10,18 @@ class Verdict:
     title: str
     subtitle: str
     color: str  # hex
+    tone: str  # QLabel "tone" property styled by the theme: red | amber | green | neutral
+
+
+# "0%".."100%": round() and the "{:.0f}" format both round the exact double half-to-even,
+# so indexing by round(v) gives the same string as formatting v.
+_PERCENT_TEXT = tuple(f"{i}%" for i in range(101))
 
 
 def format_percent(p: Optional[float]) -> str:
     if p is None:
         return "—"
-    return f"{max(0.0, min(1.0, float(p))) * 100.0:.0f}%"
+    return _PERCENT_TEXT[round(max(0.0, min(1.0, float(p))) * 100.0)]
 
 
 def confidence_label(confidence: float) -> str:
@@ -26,36 +33,46 @@ def confidence_label(confidence: float) -> str:
     return "высокая"
 
 
+_NO_DATA = Verdict(
+    title="Нет данных",
+    subtitle="Говорите в микрофон или выберите файл для анализа.",
+    color="#94a3b8",  # slate-400
+    tone="neutral",
+)
+
+
 def make_verdict(p_fake: Optional[float], *, confidence: float, threshold: float) -> Verdict:
     if p_fake is None:
-        return Verdict(
-            title="Нет данных",
-            subtitle="Говорите в микрофон или выберите файл для анализа.",
-            color="#94a3b8",  # slate-400
-        )
+        return _NO_DATA
 
     p = max(0.0, min(1.0, float(p_fake)))
     th = max(0.0, min(1.0, float(threshold)))
+    band = 2 if p >= th else 1 if p >= th * 0.60 else 0
+    # The text only depends on the band and the displayed confidence, so live updates hit the cache.
+    return _verdict(band, confidence_label(confidence), format_percent(confidence))
 
-    conf_txt = confidence_label(confidence)
-    conf_pct = format_percent(confidence)
 
-    if p >= th:
+@lru_cache(maxsize=512)
+def _verdict(band: int, conf_txt: str, conf_pct: str) -> Verdict:
+    if band == 2:
         return Verdict(
             title="Высокая вероятность: голос сгенерирован ИИ (не человек)",
             subtitle=f"Уверенность: {conf_txt} ({conf_pct}). Это вероятностная оценка, не 100% доказательство.",
             color="#ef4444",  # red-500
+            tone="red",
         )
 
-    if p >= th * 0.60:
+    if band == 1:
         return Verdict(
             title="Есть признаки синтетического голоса (возможен ИИ)",
             subtitle=f"Уверенность: {conf_txt} ({conf_pct}). Проверьте источник/условия записи.",
             color="#f59e0b",  # amber-500
+            tone="amber",
         )
 
     return Verdict(
         title="Похоже на реальный голос человека (не ИИ)",
         subtitle=f"Уверенность: {conf_txt} ({conf_pct}). Всё равно учитывайте контекст и риски мошенничества.",
         color="#22c55e",  # green-500
+        tone="green",
     )
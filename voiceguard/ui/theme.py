@@ -1,14 +1,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QCoreApplication, QSettings, QTimer
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QApplication
 
 THEME_LIGHT = "light"
 THEME_DARK = "dark"
 _THEME_KEY = "ui/theme"
+_SAVE_DELAY_MS = 500
+
+# Theme toggles are written after a short quiet period (and on quit), so rapid switching hits the
+# settings store once.
+_pending_theme: Optional[str] = None
+_save_timer: Optional[QTimer] = None
+_settings_instance: Optional[QSettings] = None
+
+
+def _settings() -> QSettings:
+    # One QSettings per process (created after app.py sets the organization/application names);
+    # each construction re-opens the backing store.
+    global _settings_instance
+    if _settings_instance is None:
+        _settings_instance = QSettings()
+    return _settings_instance
+
+
+def _write_theme(mode: str) -> None:
+    settings = _settings()
+    settings.setValue(_THEME_KEY, mode)
+    # The shared instance lives until exit, so persist now instead of relying on its destructor.
+    settings.sync()
 
 
 @dataclass(frozen=True)
@@ -107,19 +132,46 @@ DARK_THEME = ThemeSpec(
 
 
 def load_theme_preference() -> str:
-    settings = QSettings()
-    value = str(settings.value(_THEME_KEY, THEME_LIGHT))
+    if _pending_theme is not None:
+        return _pending_theme
+    value = str(_settings().value(_THEME_KEY, THEME_LIGHT))
     return value if value in {THEME_LIGHT, THEME_DARK} else THEME_LIGHT
 
 
 def save_theme_preference(mode: str) -> None:
-    settings = QSettings()
-    settings.setValue(_THEME_KEY, mode)
+    global _pending_theme, _save_timer
+    app = QCoreApplication.instance()
+    if app is None:
+        _write_theme(mode)
+        return
+    _pending_theme = mode
+    if _save_timer is None:
+        _save_timer = QTimer(app)
+        _save_timer.setSingleShot(True)
+        _save_timer.setInterval(_SAVE_DELAY_MS)
+        _save_timer.timeout.connect(_flush_theme_preference)
+        app.aboutToQuit.connect(_flush_theme_preference)
+    _save_timer.start()
+
+
+def _flush_theme_preference() -> None:
+    global _pending_theme
+    if _pending_theme is None:
+        return
+    mode, _pending_theme = _pending_theme, None
+    _write_theme(mode)
 
 
 def apply_theme(app: QApplication, mode: str = THEME_LIGHT) -> None:
     spec = DARK_THEME if mode == THEME_DARK else LIGHT_THEME
-    app.setStyle("Fusion")
+    qss = _build_stylesheet(spec)
+    if app.styleSheet() == qss:
+        return
+    # setStyle re-polishes every widget and the style never changes, so it runs once per app.
+    # (app.style() reports the stylesheet proxy once a QSS is set, hence the marker property.)
+    if app.property("voiceguard_style") != "Fusion":
+        app.setStyle("Fusion")
+        app.setProperty("voiceguard_style", "Fusion")
 
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(spec.window))
@@ -136,10 +188,12 @@ def apply_theme(app: QApplication, mode: str = THEME_LIGHT) -> None:
     palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
     app.setPalette(palette)
 
-    app.setStyleSheet(_build_stylesheet(spec))
+    app.setStyleSheet(qss)
 
 
+@lru_cache(maxsize=4)
 def _build_stylesheet(spec: ThemeSpec) -> str:
+    # One string per (frozen, hashable) spec: toggling the theme reuses it.
     return f"""
         * {{ font-size: 12.5px; font-family: "Avenir Next", "SF Pro Text", "Segoe UI Variable", "Noto Sans"; }}
         QMainWindow {{
@@ -148,6 +202,10 @@ def _build_stylesheet(spec: ThemeSpec) -> str:
         QLabel {{ color: {spec.text}; }}
         QLabel[muted="true"] {{ color: {spec.muted}; }}
         QLabel[tone="hero"] {{ color: {spec.hero}; }}
+        QLabel[tone="red"] {{ color: #ef4444; }}
+        QLabel[tone="amber"] {{ color: #f59e0b; }}
+        QLabel[tone="green"] {{ color: #22c55e; }}
+        QLabel[tone="neutral"] {{ color: #94a3b8; }}
 
         QLineEdit, QComboBox, QDoubleSpinBox {{
           background: {spec.base};
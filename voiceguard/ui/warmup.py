@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QRunnable
+
+from voiceguard.analysis import warm_up_backend
+from voiceguard.config import AppConfig
+
+
+class BackendWarmupRunnable(QRunnable):
+    def __init__(self, config: AppConfig, *, source_kind: str) -> None:
+        super().__init__()
+        self._config = config
+        self._source_kind = source_kind
+
+    def run(self) -> None:
+        try:
+            # Same model-cache key as the engine the tab builds for this source kind.
+            warm_up_backend(self._config, source_kind=self._source_kind)
+        except Exception:
+            # Best effort: the real analysis reports the same failure to the user.
+            pass
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence, Union
 
-from PySide6.QtCore import QRectF, Qt
-from PySide6.QtGui import QColor, QPainter, QPen, QPalette
+import numpy as np
+from PySide6.QtCore import QEvent, QLineF, QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QLinearGradient, QPainter, QPen, QPalette, QPolygonF
 from PySide6.QtWidgets import QWidget
 
 
@@ -14,131 +15,176 @@ class TimeSegment:
     end_sec: float
 
 
+def _column_extremes(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # Sorted positions of the min and max value within each group; `groups` is non-decreasing.
+    order = np.lexsort((values, groups))
+    g = groups[order]
+    first = np.flatnonzero(np.concatenate(([True], g[1:] != g[:-1])))
+    last = np.concatenate((first[1:] - 1, [g.size - 1]))
+    return np.union1d(order[first], order[last])
+
+
 class TimelineWidget(QWidget):
+    # Series are kept as float64 arrays; NaN (or None in list input) marks a gap in the line.
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self._times: list[float] = []
-        self._values: list[Optional[float]] = []
+        self._times = np.zeros((0,), dtype=np.float64)
+        self._values = np.zeros((0,), dtype=np.float64)
         self._threshold: Optional[float] = None
-        self._segments: list[TimeSegment] = []
+        self._segments = np.zeros((0, 2), dtype=np.float64)  # (start_sec, end_sec) rows
+
+        # Palette-derived colors and pens, rebuilt lazily after a palette change.
+        self._pens_dirty = True
+        # Plot-rect geometry (background gradient, grid lines), rebuilt when the rect or palette changes.
+        self._gradient: Optional[QLinearGradient] = None
+        self._grid_lines: list[QLineF] = []
+        self._geometry_rect: Optional[QRectF] = None
 
         self.setMinimumHeight(220)
         self.setAutoFillBackground(True)
 
     def clear(self) -> None:
-        self._times.clear()
-        self._values.clear()
-        self._segments.clear()
+        self._times = np.zeros((0,), dtype=np.float64)
+        self._values = np.zeros((0,), dtype=np.float64)
+        self._segments = np.zeros((0, 2), dtype=np.float64)
         self.update()
 
     def set_data(
         self,
         *,
-        times: list[float],
-        values: list[Optional[float]],
+        times: Union[np.ndarray, Sequence[float]],
+        values: Union[np.ndarray, Sequence[Optional[float]]],
         threshold: Optional[float] = None,
-        segments: Optional[list[TimeSegment]] = None,
+        segments: Union[np.ndarray, Sequence[TimeSegment], None] = None,
     ) -> None:
-        self._times = list(times)
-        self._values = list(values)
+        self._times = np.asarray(times, dtype=np.float64).reshape(-1)
+        # dtype=float turns None into NaN.
+        self._values = np.asarray(values, dtype=np.float64).reshape(-1)
         self._threshold = None if threshold is None else float(threshold)
-        self._segments = list(segments or [])
+        if segments is None or isinstance(segments, np.ndarray):
+            seg_arr = np.zeros((0, 2)) if segments is None else segments
+        else:
+            seg_arr = np.array([(s.start_sec, s.end_sec) for s in segments], dtype=np.float64)
+        self._segments = np.asarray(seg_arr, dtype=np.float64).reshape(-1, 2)
         self.update()
 
+    def changeEvent(self, event: QEvent) -> None:
+        # Colors come from the palette: a theme switch repaints through here.
+        if event.type() == QEvent.Type.PaletteChange:
+            self._pens_dirty = True
+            self.update()
+        super().changeEvent(event)
+
+    def _rebuild_pens(self) -> None:
+        palette = self.palette()
+        text = palette.color(QPalette.ColorRole.Text)
+        self._base_color = palette.color(QPalette.ColorRole.Base)
+        self._alt_color = palette.color(QPalette.ColorRole.AlternateBase)
+
+        grid_color = QColor(text)
+        grid_color.setAlpha(26)
+        self._grid_pen = QPen(grid_color)
+        self._grid_pen.setWidthF(1.0)
+
+        self._muted_color = QColor(text)
+        self._muted_color.setAlpha(140)
+        self._label_color = QColor(text)
+        self._label_color.setAlpha(160)
+
+        self._seg_color = QColor(249, 115, 22, 46)  # orange-500 alpha
+        self._th_pen = QPen(QColor(245, 158, 11, 190))  # amber-500
+        self._th_pen.setStyle(Qt.PenStyle.DashLine)
+        self._th_pen.setWidthF(1.2)
+
+        line_color = QColor(palette.color(QPalette.ColorRole.Highlight))
+        line_color.setAlpha(220)
+        self._line_pen = QPen(line_color)
+        self._line_pen.setWidthF(2.0)
+
+        self._gradient = None
+        self._pens_dirty = False
+
     def paintEvent(self, event) -> None:  # noqa: ANN001
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         rect = QRectF(self.rect()).adjusted(12.0, 12.0, -12.0, -18.0)
-        base = self.palette().color(QPalette.ColorRole.Base)
-        alt = self.palette().color(QPalette.ColorRole.AlternateBase)
-        text = self.palette().color(QPalette.ColorRole.Text)
-        grad = None
-        try:
-            from PySide6.QtGui import QLinearGradient  # type: ignore
-
-            grad = QLinearGradient(rect.topLeft(), rect.bottomRight())
-            grad.setColorAt(0.0, base)
-            grad.setColorAt(1.0, alt)
-        except Exception:
-            grad = None
-
-        painter.fillRect(rect, grad or base)
+        if self._pens_dirty:
+            self._rebuild_pens()
+        if self._gradient is None or self._geometry_rect != rect:
+            self._gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
+            self._gradient.setColorAt(0.0, self._base_color)
+            self._gradient.setColorAt(1.0, self._alt_color)
+            ys = [rect.top() + rect.height() * (i / 4.0) for i in range(1, 4)]
+            self._grid_lines = [QLineF(rect.left(), y, rect.right(), y) for y in ys]
+            self._geometry_rect = rect
+
+        painter.fillRect(rect, self._gradient)
 
         # Axes / grid.
-        grid_color = QColor(text)
-        grid_color.setAlpha(26)
-        grid_pen = QPen(grid_color)
-        grid_pen.setWidthF(1.0)
-        painter.setPen(grid_pen)
-        for i in range(1, 4):
-            y = rect.top() + rect.height() * (i / 4.0)
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
 
         # No data yet.
-        if not self._times or not self._values:
-            muted = QColor(text)
-            muted.setAlpha(140)
-            painter.setPen(muted)
+        if self._times.size == 0 or self._values.size == 0:
+            painter.setPen(self._muted_color)
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "Нет данных")
             painter.end()
             return
 
-        t_min = float(min(self._times))
-        t_max = float(max(self._times))
+        t_min = float(np.min(self._times))
+        t_max = float(np.max(self._times))
         if t_max <= t_min:
             t_max = t_min + 1e-6
 
-        def x_of(t: float) -> float:
-            return rect.left() + (float(t) - t_min) / (t_max - t_min) * rect.width()
-
         def y_of(v: float) -> float:
             v = min(max(float(v), 0.0), 1.0)
             return rect.bottom() - v * rect.height()
 
         # Alert segments overlay.
-        if self._segments:
-            seg_color = QColor(249, 115, 22, 46)  # orange-500 alpha
-            for seg in self._segments:
-                sx = x_of(seg.start_sec)
-                ex = x_of(seg.end_sec)
+        if self._segments.size:
+            seg_color = self._seg_color
+            seg_x = rect.left() + (self._segments - t_min) * (rect.width() / (t_max - t_min))
+            for sx, ex in seg_x.tolist():
                 painter.fillRect(QRectF(sx, rect.top(), max(0.0, ex - sx), rect.height()), seg_color)
 
         # Threshold line.
         if self._threshold is not None:
             th = float(self._threshold)
             if 0.0 <= th <= 1.0:
-                th_pen = QPen(QColor(245, 158, 11, 190))  # amber-500
-                th_pen.setStyle(Qt.PenStyle.DashLine)
-                th_pen.setWidthF(1.2)
-                painter.setPen(th_pen)
+                painter.setPen(self._th_pen)
                 y = y_of(th)
                 painter.drawLine(rect.left(), y, rect.right(), y)
 
         # Series line.
-        line_color = QColor(self.palette().color(QPalette.ColorRole.Highlight))
-        line_color.setAlpha(220)
-        line_pen = QPen(line_color)
-        line_pen.setWidthF(2.0)
-        painter.setPen(line_pen)
-
-        prev_x: Optional[float] = None
-        prev_y: Optional[float] = None
-        for t, v in zip(self._times, self._values):
-            if v is None:
-                prev_x = None
-                prev_y = None
-                continue
-            x = x_of(float(t))
-            y = y_of(float(v))
-            if prev_x is not None and prev_y is not None:
-                painter.drawLine(prev_x, prev_y, x, y)
-            prev_x, prev_y = x, y
+        painter.setPen(self._line_pen)
+
+        n = min(int(self._times.size), int(self._values.size))
+        values = self._values[:n]
+        frac = (self._times[:n] - t_min) / (t_max - t_min)
+        xs = rect.left() + frac * rect.width()
+        ys = rect.bottom() - np.clip(values, 0.0, 1.0) * rect.height()
+        # Points with a value, and which run of consecutive valid points each belongs to.
+        valid = ~np.isnan(values)
+        run_starts = valid.copy()
+        run_starts[1:] &= ~valid[:-1]
+        sel = np.flatnonzero(valid)
+        runs = np.cumsum(run_starts)[sel]
+        width = max(1, int(rect.width()))
+        if sel.size > 2 * width:
+            # Long series: per pixel column (within a run) only the min and max points are visible.
+            cols = np.clip((frac[sel] * width).astype(np.int64), 0, width)
+            keep = _column_extremes(runs * (width + 1) + cols, values[sel])
+            sel, runs = sel[keep], runs[keep]
+        # One polyline per run.
+        bounds = np.flatnonzero(np.diff(runs)) + 1
+        for r0, r1 in zip([0, *bounds.tolist()], [*bounds.tolist(), int(sel.size)]):
+            if r1 - r0 >= 2:
+                idx = sel[r0:r1]
+                painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs[idx].tolist(), ys[idx].tolist())]))
 
         # Labels.
-        label_color = QColor(text)
-        label_color.setAlpha(160)
-        painter.setPen(label_color)
+        painter.setPen(self._label_color)
         painter.drawText(
             QRectF(rect.left(), rect.bottom() + 2.0, rect.width(), 16.0),
             Qt.AlignmentFlag.AlignLeft,
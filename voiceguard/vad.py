@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 
@@ -7,10 +9,23 @@ def rms_db(audio: np.ndarray, eps: float = 1e-12) -> float:
     audio = audio.astype(np.float32, copy=False)
     if audio.size == 0:
         return float("-inf")
-    rms = float(np.sqrt(np.mean(np.square(audio))))
-    return 20.0 * float(np.log10(rms + eps))
+    # dot() sums the squares in one BLAS call, without a squared temporary.
+    rms = math.sqrt(float(np.dot(audio, audio)) / audio.size)
+    return 20.0 * math.log10(rms + eps)
 
 
 def is_speech_window(audio: np.ndarray, threshold_db: float) -> bool:
     return rms_db(audio) > float(threshold_db)
 
+
+def sliding_rms_db(
+    audio: np.ndarray, *, starts: np.ndarray, window_samples: int, eps: float = 1e-12
+) -> np.ndarray:
+    # Per-window rms_db for all windows at once; float64 prefix sums keep long clips exact enough.
+    x = audio.astype(np.float64).reshape(-1)
+    energy = np.zeros((x.size + 1,), dtype=np.float64)
+    np.cumsum(np.square(x), out=energy[1:])
+    lo = np.minimum(starts, x.size)
+    hi = np.minimum(starts + int(window_samples), x.size)
+    rms = np.sqrt(np.maximum(energy[hi] - energy[lo], 0.0) / float(max(1, int(window_samples))))
+    return 20.0 * np.log10(rms + eps)
@@ -31,18 +31,27 @@ def window_params(*, sample_rate: int, window_sec: float, hop_sec: float) -> tup
 def iter_windows(
     audio: np.ndarray, *, window_samples: int, hop_samples: int
 ) -> Iterator[Tuple[int, np.ndarray]]:
+    # Rows of the strided window_frames view: one view for all windows instead of a slice per step.
+    starts, frames = window_frames(audio, window_samples=window_samples, hop_samples=hop_samples)
+    yield from zip(starts.tolist(), frames)
+
+
+def window_frames(
+    audio: np.ndarray, *, window_samples: int, hop_samples: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Same windows as iter_windows, as (starts, frames) with frames a zero-copy (N, W) view.
     audio = audio.astype(np.float32, copy=False).reshape(-1)
     if audio.size == 0:
-        return
+        return np.zeros((0,), dtype=np.int64), np.zeros((0, int(window_samples)), dtype=np.float32)
 
     if audio.size < window_samples:
-        padded = np.zeros((window_samples,), dtype=np.float32)
-        padded[: audio.size] = audio
-        yield 0, padded
-        return
+        padded = np.zeros((1, window_samples), dtype=np.float32)
+        padded[0, : audio.size] = audio
+        return np.zeros((1,), dtype=np.int64), padded
 
-    for start in range(0, int(audio.size - window_samples + 1), int(hop_samples)):
-        yield int(start), audio[int(start) : int(start + window_samples)]
+    frames = np.lib.stride_tricks.sliding_window_view(audio, int(window_samples))[:: int(hop_samples)]
+    starts = np.arange(frames.shape[0], dtype=np.int64) * int(hop_samples)
+    return starts, frames
 
 
 @dataclass(frozen=True)
@@ -61,8 +70,11 @@ class StreamWindowProcessor:
         if self._hop_samples <= 0:
             raise ValueError("hop_sec is too small (<= 0 samples)")
 
-        self._buffer = np.zeros((0,), dtype=np.float32)
+        # Preallocated linear buffer: pushes append in place and the consumed head is only dropped
+        # (by moving the retained tail to the front) when the next chunk does not fit.
+        self._buffer = np.zeros((2 * (self._window_samples + self._hop_samples),), dtype=np.float32)
         self._buffer_start = 0  # global sample index of buffer[0]
+        self._filled = 0  # valid samples in buffer
         self._total_samples = 0
         self._next_window_start = 0
 
@@ -79,33 +91,36 @@ class StreamWindowProcessor:
         return self._hop_samples
 
     def push(self, samples: np.ndarray) -> list[StreamWindow]:
-        samples = samples.astype(np.float32, copy=False).reshape(-1)
-        if samples.size == 0:
+        # Returned windows are views into the internal buffer, valid until the next push.
+        # No astype here: copying into the float32 buffer below converts other dtypes on the fly.
+        if samples.ndim != 1:
+            samples = samples.reshape(-1)
+        n = int(samples.size)
+        if n == 0:
             return []
 
-        self._buffer = np.concatenate([self._buffer, samples])
-        self._total_samples += int(samples.size)
+        if self._filled + n > self._buffer.size:
+            # Everything before the next window start is consumed.
+            drop = min(self._filled, max(0, self._next_window_start - self._buffer_start))
+            kept = self._filled - drop
+            if kept + n > self._buffer.size:
+                grown = np.zeros((max(2 * self._buffer.size, kept + n),), dtype=np.float32)
+                grown[:kept] = self._buffer[drop : self._filled]
+                self._buffer = grown
+            elif kept:
+                self._buffer[:kept] = self._buffer[drop : self._filled]
+            self._buffer_start += drop
+            self._filled = kept
+
+        self._buffer[self._filled : self._filled + n] = samples
+        self._filled += n
+        self._total_samples += n
 
         windows: list[StreamWindow] = []
         while self._next_window_start + self._window_samples <= self._total_samples:
-            start_offset = self._next_window_start - self._buffer_start
-            if start_offset < 0:
-                # Shouldn't happen, but keep safe.
-                start_offset = 0
-                self._next_window_start = self._buffer_start
-
-            end_offset = start_offset + self._window_samples
-            if end_offset > self._buffer.size:
-                break
-
-            window = self._buffer[start_offset:end_offset]
+            offset = self._next_window_start - self._buffer_start
+            window = self._buffer[offset : offset + self._window_samples]
             windows.append(StreamWindow(start_sample=int(self._next_window_start), samples=window))
-            self._next_window_start += int(self._hop_samples)
-
-        # Trim everything before the next window start to keep memory bounded.
-        trim = max(0, int(self._next_window_start - self._buffer_start))
-        if trim > 0:
-            self._buffer = self._buffer[trim:]
-            self._buffer_start += trim
+            self._next_window_start += self._hop_samples
 
         return windows